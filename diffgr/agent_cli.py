@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 import shutil
@@ -61,6 +62,9 @@ def load_agent_cli_config(path: Path) -> AgentCliConfig:
     )
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+
 def extract_first_json_object(text: str) -> dict[str, Any]:
     text = text.strip()
     if not text:
@@ -73,20 +77,31 @@ def extract_first_json_object(text: str) -> dict[str, Any]:
     except json.JSONDecodeError:
         pass
 
-    decoder = json.JSONDecoder()
-    for index, char in enumerate(text):
-        if char != "{":
-            continue
+    index = text.find("{")
+    while index != -1:
         try:
-            obj, _end = decoder.raw_decode(text[index:])
+            obj, _end = _JSON_DECODER.raw_decode(text, index)
         except json.JSONDecodeError:
-            continue
-        if isinstance(obj, dict):
-            return obj
+            pass
+        else:
+            if isinstance(obj, dict):
+                return obj
+        index = text.find("{", index + 1)
     raise RuntimeError("Failed to parse JSON object from agent output.")
 
 
+def which_command(command: str) -> str | None:
+    """Like ``shutil.which``, but also tries .cmd/.bat/.exe/.com on Windows; cached per PATH/PATHEXT."""
+    return _resolve_command(command, os.environ.get("PATH", ""), os.environ.get("PATHEXT", ""))
+
+
 def _resolve_command_for_subprocess(command: str) -> str:
+    return which_command(command) or command
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_command(command: str, path_env: str, pathext_env: str) -> str | None:
+    # path_env/pathext_env are only part of the cache key: a changed PATH re-resolves.
     resolved = shutil.which(command)
     if resolved:
         return resolved
@@ -99,7 +114,7 @@ def _resolve_command_for_subprocess(command: str) -> str:
                 if resolved_with_ext:
                     return resolved_with_ext
 
-    return command
+    return None
 
 
 def _normalize_codex_exec_args(args: tuple[str, ...]) -> tuple[str, ...]:
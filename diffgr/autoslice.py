@@ -262,12 +262,13 @@ def autoslice_document_by_commits(
     # Drop empty groups from assignments to keep the file small, but keep them in groups list.
     assignments = {group_id: ids for group_id, ids in assignments.items() if ids}
 
+    # Shallow copies only: the input document (including its meta) is left untouched.
     new_doc = dict(doc)
     new_doc["groups"] = groups
     new_doc["chunks"] = new_chunks
     new_doc["assignments"] = assignments
     new_doc["reviews"] = new_reviews
-    new_doc.setdefault("meta", {}).setdefault("x-autoslice", {})
+    new_doc["meta"] = dict(doc.get("meta") or {})
     new_doc["meta"]["x-autoslice"] = {
         "method": "commits",
         "base": base_ref,
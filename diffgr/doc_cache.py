@@ -0,0 +1,103 @@
+"""On-disk cache of validated DiffGR documents for repeat CLI runs.
+
+Entries are JSON files keyed by ``_CACHE_VERSION`` and the resolved input path
+plus its inode, mtime and size, so editing or replacing the file invalidates
+them; one entry is kept per path and at most ``_MAX_ENTRIES`` overall (oldest
+first out). The cache lives under ``DIFFGR_CACHE_DIR`` (default:
+``$XDG_CACHE_HOME/diffgr`` or ``~/.cache/diffgr``); setting ``DIFFGR_CACHE_DIR``
+to an empty string disables it. On POSIX the directory and entries are only
+used while they belong to the current user and are not group/other writable,
+since anyone who can write them can feed documents to the tools. Any cache
+failure falls back to a normal parse.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from diffgr.viewer_core import _loads, load_json, validate_document
+
+# Bump when the entry shape or validate_document's warnings change, so older entries are ignored.
+_CACHE_VERSION = 2
+_MAX_ENTRIES = 64
+
+
+def document_cache_dir() -> Path | None:
+    configured = os.environ.get("DIFFGR_CACHE_DIR")
+    if configured is not None:
+        return Path(configured).expanduser() if configured.strip() else None
+    xdg = os.environ.get("XDG_CACHE_HOME", "").strip()
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "diffgr"
+
+
+def _cache_entry_path(cache_dir: Path, path: Path) -> Path | None:
+    try:
+        resolved = path.resolve()
+        stat = resolved.stat()
+    except OSError:
+        return None
+    path_key = hashlib.sha256(str(resolved).encode("utf-8")).hexdigest()[:32]
+    return cache_dir / f"{path_key}-v{_CACHE_VERSION}-{stat.st_ino}-{stat.st_mtime_ns}-{stat.st_size}.json"
+
+
+def _is_private(path: Path) -> bool:
+    """True unless *path* belongs to another user or is group/other writable (POSIX only)."""
+    if not hasattr(os, "getuid"):
+        return True
+    stat = path.stat()
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def _prune_entries(cache_dir: Path) -> None:
+    entries = []
+    for entry in cache_dir.glob(f"*-v{_CACHE_VERSION}-*-*-*.json"):
+        try:
+            entries.append((entry.stat().st_mtime_ns, entry))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+    for _mtime, entry in entries[_MAX_ENTRIES:]:
+        entry.unlink(missing_ok=True)
+
+
+def load_validated_document(path: Path) -> dict[str, Any]:
+    """``load_json`` + ``validate_document``, served from the cache when the file is unchanged."""
+    return load_document_with_warnings(path)[0]
+
+
+def load_document_with_warnings(path: Path) -> tuple[dict[str, Any], list[str]]:
+    """Like :func:`load_validated_document`, also returning ``validate_document`` warnings."""
+    cache_dir = document_cache_dir()
+    entry = _cache_entry_path(cache_dir, path) if cache_dir is not None else None
+    if entry is not None:
+        try:
+            if _is_private(entry.parent) and _is_private(entry):
+                doc, warnings = _loads(entry.read_bytes())
+                if isinstance(doc, dict) and isinstance(warnings, list):
+                    return doc, warnings
+        except Exception:  # noqa: BLE001
+            pass
+    doc = load_json(path)
+    warnings = validate_document(doc)
+    if entry is not None:
+        temp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        try:
+            entry.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not _is_private(entry.parent):
+                return doc, warnings
+            # Drop entries for older versions of the same file so the cache stays one entry per input.
+            for stale in entry.parent.glob(f"{entry.name.split('-', 1)[0]}-v*-*-*-*.json"):
+                stale.unlink(missing_ok=True)
+            raw = json.dumps([doc, warnings], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            with os.fdopen(os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o600), "wb") as handle:
+                handle.write(raw)
+            os.replace(temp, entry)
+            _prune_entries(entry.parent)
+        except OSError:
+            temp.unlink(missing_ok=True)
+    return doc, warnings
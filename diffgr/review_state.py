@@ -19,7 +19,7 @@ from diffgr.review_utils import (
     normalize_review_status as _normalize_review_status,
     normalized_line_comments as _normalized_line_comments,
 )
-from diffgr.viewer_core import load_json, validate_document, write_json
+from diffgr.viewer_core import load_json, validate_document, write_json_atomic
 
 STATE_KEYS = ("reviews", "groupBriefs", "analysisState", "threadState")
 STATE_SELECTION_SECTIONS = ("reviews", "groupBriefs", "analysisState", "threadState", "threadState.__files")
@@ -81,7 +81,7 @@ def review_state_fingerprint(state: dict[str, Any]) -> str:
 def save_review_state(path: Path, state: dict[str, Any]) -> dict[str, dict[str, Any]]:
     normalized = normalize_review_state_payload(state)
     path.parent.mkdir(parents=True, exist_ok=True)
-    write_json(path, normalized)
+    write_json_atomic(path, normalized)
     return normalized
 
 
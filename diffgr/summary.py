@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import asdict
 from typing import Any
 
@@ -10,11 +11,9 @@ from diffgr.virtual_pr_coverage import analyze_virtual_pr_coverage
 
 def _status_counts(chunk_ids: list[str], status_map: dict[str, str]) -> dict[str, int]:
     counts = {status: 0 for status in VALID_STATUSES}
-    for chunk_id in chunk_ids:
-        status = status_map.get(chunk_id, "unreviewed")
-        if status not in VALID_STATUSES:
-            status = "unreviewed"
-        counts[status] += 1
+    # Tally in C, then fold missing (None) and unknown statuses into "unreviewed".
+    for status, count in Counter(map(status_map.get, chunk_ids)).items():
+        counts[status if status in VALID_STATUSES else "unreviewed"] += count
     return counts
 
 
@@ -24,9 +24,12 @@ from .review_state import (
     summarize_merge_result,
     summarize_review_state,
 )
+from .doc_cache import load_document_with_warnings
 from .impact_merge import build_impact_preview_report, preview_impact_apply, preview_impact_merge
 from .viewer_core import (
     VALID_STATUSES,
+    assigned_chunk_set,
+    build_file_path_index,
     build_indexes,
     compute_metrics,
     filter_chunks,
@@ -520,8 +523,17 @@ def run_prompt_app(
 ) -> int:
     active_group, active_status, active_file, selected_chunk_id = _restore_prompt_analysis_state(doc, chunk_map)
     bound_state_path = state_path
+    # State commands rebind doc but never change its assignments, so the union is computed once.
+    assigned_ids = assigned_chunk_set(doc)
+
+    indexed_chunk_map: dict[str, Any] | None = None
+    file_path_index: dict[str, str] = {}
 
     def get_filtered_chunks() -> list[dict[str, Any]]:
+        nonlocal indexed_chunk_map, file_path_index
+        # chunk_map is rebound on state-load/state-apply; rebuild the lower-cased path index only then.
+        if indexed_chunk_map is not chunk_map:
+            indexed_chunk_map, file_path_index = chunk_map, build_file_path_index(chunk_map)
         return filter_chunks(
             doc=doc,
             chunk_map=chunk_map,
@@ -530,9 +542,10 @@ def run_prompt_app(
             chunk_id=None,
             status_filter=active_status,
             file_contains=active_file,
+            file_path_index=file_path_index,
         )
 
-    metrics = compute_metrics(doc, status_map)
+    metrics = compute_metrics(doc, status_map, assigned_ids)
     render_summary(console, doc, metrics, len(warnings))
     if warnings:
         for warning in warnings:
@@ -557,7 +570,7 @@ def run_prompt_app(
             render_groups(console, doc)
             continue
         if command == "metrics":
-            metrics = compute_metrics(doc, status_map)
+            metrics = compute_metrics(doc, status_map, assigned_ids)
             render_summary(console, doc, metrics, len(warnings))
             continue
         if command == "state-show":
@@ -1321,17 +1334,17 @@ def run_app(argv: list[str]) -> int:
     path = resolve_input_path(Path(args.path), search_roots=[Path(__file__).resolve().parents[1]])
     state_path = resolve_input_path(Path(args.state), search_roots=[Path(__file__).resolve().parents[1]]) if args.state else None
     try:
-        doc = load_json(path)
-        warnings = validate_document(doc)
+        doc, warnings = load_document_with_warnings(path)
         if state_path is not None and state_path.exists():
             doc = apply_review_state(doc, load_review_state(state_path))
         chunk_map, status_map = build_indexes(doc)
+        # The interactive UIs compute their own metrics as the review state changes.
+        metrics = compute_metrics(doc, status_map) if args.once else None
     except Exception as error:  # noqa: BLE001
         print(f"[error] {error}", file=sys.stderr)
         return 1
 
     if args.once:
-        metrics = compute_metrics(doc, status_map)
         render_summary(console, doc, metrics, len(warnings))
         if warnings:
             for warning in warnings:
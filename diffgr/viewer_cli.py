@@ -7,15 +7,14 @@ from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 
+from .doc_cache import load_document_with_warnings
 from .viewer_core import (
     VALID_STATUSES,
     build_indexes,
     compute_metrics,
     filter_chunks,
-    load_json,
     print_json,
     resolve_input_path,
-    validate_document,
 )
 from .viewer_render import (
     render_chunk_detail,
@@ -43,9 +42,9 @@ def run_view(argv: list[str]) -> int:
     path = resolve_input_path(Path(args.path), search_roots=[Path(__file__).resolve().parents[1]])
     console = Console()
     try:
-        doc = load_json(path)
-        warnings = validate_document(doc)
+        doc, warnings = load_document_with_warnings(path)
         chunk_map, status_map = build_indexes(doc)
+        metrics = compute_metrics(doc, status_map)
         chunks = filter_chunks(
             doc=doc,
             chunk_map=chunk_map,
@@ -75,7 +74,6 @@ def run_view(argv: list[str]) -> int:
         print_json(payload)
         return 0
 
-    metrics = compute_metrics(doc, status_map)
     render_summary(console, doc, metrics, len(warnings))
     if warnings:
         for warning in warnings:
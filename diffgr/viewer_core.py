@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 import json
+import os
+import stat
 import sys
+import threading
+from collections import Counter
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
-VALID_STATUSES = {"unreviewed", "reviewed", "ignored", "needsReReview"}
+try:
+    import orjson
+except ImportError:  # Optional accelerator; stdlib json stays the reference behaviour.
+    orjson = None
+
+VALID_STATUSES = frozenset({"unreviewed", "reviewed", "ignored", "needsReReview"})
 
 
 def build_chunk_map(doc_or_chunks: dict[str, Any] | list) -> dict[str, dict[str, Any]]:
@@ -38,9 +48,32 @@ def resolve_input_path(path: Path, search_roots: list[Path] | None = None) -> Pa
     return primary
 
 
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # Re-parse with json: it accepts big ints/NaN/BOM and owns the error messages.
+    return json.loads(raw)
+
+
+def _dumps_pretty(obj: Any) -> str:
+    # Always stdlib json: orjson writes NaN/Infinity as null without raising, spells
+    # exponents differently (1e16 vs 1e+16) and silently serializes dataclasses/UUIDs.
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def _dumps_pretty_bytes(obj: Any) -> bytes:
+    """UTF-8 bytes of :func:`_dumps_pretty` plus a trailing newline, for file writes.
+
+    Files always get ``\n`` line endings, also on Windows.
+    """
+    return (_dumps_pretty(obj) + "\n").encode("utf-8")
+
+
 def load_json(path: Path) -> dict[str, Any]:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _loads(path.read_bytes())
     except FileNotFoundError as error:
         raise RuntimeError(f"File not found: {path}") from error
     except json.JSONDecodeError as error:
@@ -49,12 +82,35 @@ def load_json(path: Path) -> dict[str, Any]:
 
 def write_json(path: Path, obj: Any) -> None:
     """Write *obj* as pretty-printed JSON with a trailing newline."""
-    path.write_text(json.dumps(obj, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    path.write_bytes(_dumps_pretty_bytes(obj))
+
+
+def write_json_atomic(path: Path, obj: Any) -> None:
+    """Write *obj* like :func:`write_json`, but never leave *path* half-written.
+
+    The JSON goes to a sibling temp file that is fsynced and then renamed over
+    *path*, so concurrent readers see either the old or the new document.
+    """
+    raw = _dumps_pretty_bytes(obj)
+    temp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temp, "xb") as handle:
+            handle.write(raw)
+            handle.flush()
+            os.fsync(handle.fileno())
+        try:
+            os.chmod(temp, stat.S_IMODE(path.stat().st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(temp, path)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
 
 
 def print_json(obj: Any) -> None:
     """Print *obj* as pretty-printed JSON to stdout with a trailing newline."""
-    print(json.dumps(obj, ensure_ascii=False, indent=2))
+    print(_dumps_pretty(obj))
 
 
 def print_error(msg: object) -> None:
@@ -73,6 +129,52 @@ def resolve_script_path(path_str: str, root: Path) -> Path:
     return (root / p if not p.is_absolute() else p).resolve()
 
 
+def parse_simple_flags(
+    argv: list[str],
+    *,
+    options: dict[str, Any],
+    switches: tuple[str, ...] = (),
+    required: tuple[str, ...] = (),
+) -> SimpleNamespace | None:
+    """Parse plain ``--flag value`` / ``--switch`` argv without building an argparse parser.
+
+    ``options`` maps value flags to their defaults. Returns None for anything
+    outside that shape (``--help``, ``--flag=value``, unknown or missing flags)
+    so callers can fall back to argparse for full behaviour and error messages.
+    """
+    values: dict[str, Any] = dict(options)
+    values.update((name, False) for name in switches)
+    index = 0
+    while index < len(argv):
+        token = argv[index]
+        if token in switches:
+            values[token] = True
+            index += 1
+            continue
+        if token not in options or index + 1 >= len(argv) or argv[index + 1].startswith("-"):
+            return None
+        values[token] = argv[index + 1]
+        index += 2
+    if any(values[name] is None for name in required):
+        return None
+    return SimpleNamespace(**{name[2:].replace("-", "_"): value for name, value in values.items()})
+
+
+def _collect_ids(items: list[Any]) -> tuple[set[Any], bool]:
+    """Return the set of ``id`` values of dict items and whether any id repeats, in one pass."""
+    ids: set[Any] = set()
+    duplicated = False
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        item_id = item.get("id")
+        if item_id in ids:
+            duplicated = True
+        else:
+            ids.add(item_id)
+    return ids, duplicated
+
+
 def validate_document(doc: dict[str, Any]) -> list[str]:
     warnings: list[str] = []
     required_keys = ["format", "version", "meta", "groups", "chunks", "assignments", "reviews"]
@@ -89,68 +191,85 @@ def validate_document(doc: dict[str, Any]) -> list[str]:
     assignments = doc["assignments"]
     reviews = doc["reviews"]
 
-    group_ids = [group.get("id") for group in groups if isinstance(group, dict)]
-    chunk_ids = [chunk.get("id") for chunk in chunks if isinstance(chunk, dict)]
-    if len(group_ids) != len(set(group_ids)):
+    group_set, duplicate_groups = _collect_ids(groups)
+    chunk_set, duplicate_chunks = _collect_ids(chunks)
+    if duplicate_groups:
         warnings.append("Duplicate group ids detected.")
-    if len(chunk_ids) != len(set(chunk_ids)):
+    if duplicate_chunks:
         warnings.append("Duplicate chunk ids detected.")
 
-    group_set = set(group_ids)
-    chunk_set = set(chunk_ids)
-    for group_id in group_set:
-        if group_id not in assignments:
-            warnings.append(f"Group missing assignments entry: {group_id}")
+    # Set operations find the (usually empty) problem cases; the loops below only run to
+    # report them in document order.
+    missing_groups = group_set - assignments.keys()
+    if missing_groups:
+        for group in groups:
+            group_id = group.get("id") if isinstance(group, dict) else None
+            if group_id in missing_groups:
+                missing_groups.discard(group_id)
+                warnings.append(f"Group missing assignments entry: {group_id}")
     for group_id, assigned in assignments.items():
         if group_id not in group_set:
             warnings.append(f"Assignment key not in groups: {group_id}")
         if not isinstance(assigned, list):
             warnings.append(f"Assignment value must be array: {group_id}")
             continue
+        if chunk_set.issuperset(assigned):
+            continue
         for chunk_id in assigned:
             if chunk_id not in chunk_set:
                 warnings.append(f"Assigned chunk id not found: {chunk_id}")
 
-    for chunk_id in reviews.keys():
-        if chunk_id not in chunk_set:
-            warnings.append(f"Review key chunk id not found: {chunk_id}")
+    if reviews.keys() - chunk_set:
+        for chunk_id in reviews:
+            if chunk_id not in chunk_set:
+                warnings.append(f"Review key chunk id not found: {chunk_id}")
     return warnings
 
 
 def build_indexes(doc: dict[str, Any]) -> tuple[dict[str, Any], dict[str, str]]:
-    chunk_map = build_chunk_map(doc)
+    reviews = doc["reviews"]
+    chunk_map: dict[str, Any] = {}
     status_map: dict[str, str] = {}
-    for chunk_id in chunk_map.keys():
-        status = doc["reviews"].get(chunk_id, {}).get("status", "unreviewed")
+    for chunk in doc.get("chunks", []) or []:
+        if not isinstance(chunk, dict):
+            continue
+        chunk_id = str(chunk.get("id", ""))
+        if not chunk_id:
+            continue
+        chunk_map[chunk_id] = chunk
+        if chunk_id in status_map:
+            continue
+        status = reviews.get(chunk_id, {}).get("status", "unreviewed")
         if status not in VALID_STATUSES:
             status = "unreviewed"
         status_map[chunk_id] = status
     return chunk_map, status_map
 
 
-def compute_metrics(doc: dict[str, Any], status_map: dict[str, str]) -> dict[str, Any]:
-    chunk_ids = {chunk["id"] for chunk in doc["chunks"]}
+def assigned_chunk_set(doc: dict[str, Any]) -> set[str]:
     assigned: set[str] = set()
     for values in doc["assignments"].values():
         if isinstance(values, list):
             assigned.update(values)
-    unassigned = chunk_ids - assigned
-    ignored = {chunk_id for chunk_id, status in status_map.items() if status == "ignored"}
-    tracked = chunk_ids - ignored
-    reviewed = {chunk_id for chunk_id in tracked if status_map.get(chunk_id) == "reviewed"}
-    pending = {
-        chunk_id
-        for chunk_id in tracked
-        if status_map.get(chunk_id) in {"unreviewed", "needsReReview"}
-    }
-    tracked_count = len(tracked)
-    coverage_rate = 1.0 if tracked_count == 0 else len(reviewed) / tracked_count
+    return assigned
+
+
+def compute_metrics(
+    doc: dict[str, Any],
+    status_map: dict[str, str],
+    assigned: set[str] | None = None,
+) -> dict[str, Any]:
+    chunk_ids = {chunk["id"] for chunk in doc["chunks"]}
+    if assigned is None:
+        assigned = assigned_chunk_set(doc)
+    counts = Counter(map(status_map.get, chunk_ids))
+    tracked_count = len(chunk_ids) - counts["ignored"]
     return {
-        "Unassigned": len(unassigned),
-        "Reviewed": len(reviewed),
-        "Pending": len(pending),
+        "Unassigned": len(chunk_ids - assigned),
+        "Reviewed": counts["reviewed"],
+        "Pending": counts["unreviewed"] + counts["needsReReview"],
         "Tracked": tracked_count,
-        "CoverageRate": coverage_rate,
+        "CoverageRate": 1.0 if tracked_count == 0 else counts["reviewed"] / tracked_count,
     }
 
 
@@ -162,6 +281,7 @@ def filter_chunks(
     chunk_id: str | None,
     status_filter: str | None,
     file_contains: str | None,
+    file_path_index: dict[str, str] | None = None,
 ) -> list[dict[str, Any]]:
     candidates: list[dict[str, Any]]
     if group_id:
@@ -173,15 +293,30 @@ def filter_chunks(
             if not group_exists:
                 raise LookupError(f"Group not found in assignments: {group_id}")
             assigned = []
-        candidates = [chunk_map[item] for item in assigned if item in chunk_map]
+        if chunk_id:
+            candidates = [chunk_map[chunk_id]] if chunk_id in chunk_map and chunk_id in assigned else []
+        else:
+            candidates = [chunk_map[item] for item in assigned if item in chunk_map]
+    elif chunk_id:
+        candidates = [chunk_map[chunk_id]] if chunk_id in chunk_map else []
     else:
         candidates = list(chunk_map.values())
 
-    if chunk_id:
-        candidates = [item for item in candidates if item.get("id") == chunk_id]
     if status_filter:
         candidates = [item for item in candidates if status_map.get(item["id"]) == status_filter]
     if file_contains:
         lookup = file_contains.lower()
-        candidates = [item for item in candidates if lookup in item.get("filePath", "").lower()]
+        if file_path_index is None:
+            candidates = [item for item in candidates if lookup in item.get("filePath", "").lower()]
+        else:
+            candidates = [
+                item
+                for item in candidates
+                if lookup in (file_path_index.get(item["id"]) or item.get("filePath", "").lower())
+            ]
     return candidates
+
+
+def build_file_path_index(chunk_map: dict[str, Any]) -> dict[str, str]:
+    """Lower-cased ``filePath`` per chunk id, for repeated ``filter_chunks(file_contains=...)`` calls."""
+    return {chunk_id: str(chunk.get("filePath", "")).lower() for chunk_id, chunk in chunk_map.items()}
@@ -10,15 +10,13 @@ from rich.text import Text
 
 from diffgr.review_state import STATE_DIFF_SECTIONS, build_merge_preview_report, iter_review_state_diff_rows
 
+_KIND_PREFIX = {"context": " ", "add": "+", "delete": "-", "meta": "\\"}
+_KIND_STYLE = {"add": "green", "delete": "red"}
+_STATUS_STYLE = {"reviewed": "green", "needsReReview": "yellow", "ignored": "dim"}
+
 
 def status_style(status: str) -> str:
-    if status == "reviewed":
-        return "green"
-    if status == "needsReReview":
-        return "yellow"
-    if status == "ignored":
-        return "dim"
-    return "white"
+    return _STATUS_STYLE.get(status, "white")
 
 
 def render_summary(
@@ -27,12 +25,13 @@ def render_summary(
     metrics: dict[str, Any],
     warning_count: int,
 ) -> None:
-    source = doc.get("meta", {}).get("source", {})
+    meta = doc.get("meta") or {}
+    source = meta.get("source") or {}
     table = Table.grid(padding=(0, 2))
     table.add_column(style="bold cyan")
     table.add_column()
-    table.add_row("Title", str(doc.get("meta", {}).get("title", "-")))
-    table.add_row("CreatedAt", str(doc.get("meta", {}).get("createdAt", "-")))
+    table.add_row("Title", str(meta.get("title", "-")))
+    table.add_row("CreatedAt", str(meta.get("createdAt", "-")))
     table.add_row("Source", f"{source.get('type', '-')} ({source.get('base', '-')} -> {source.get('head', '-')})")
     table.add_row("Groups", str(len(doc.get("groups", []))))
     table.add_row("Chunks", str(len(doc.get("chunks", []))))
@@ -458,15 +457,14 @@ def render_chunk_detail(
     lines_table.add_column("new", justify="right")
     lines_table.add_column("kind")
     lines_table.add_column("content")
-    for line in chunk.get("lines", [])[:max_lines]:
+    add_row = lines_table.add_row
+    for line in (chunk.get("lines") or [])[:max_lines]:
         kind = line.get("kind", "")
-        prefix = {"context": " ", "add": "+", "delete": "-", "meta": "\\"}.get(kind, "?")
-        style = status_style("reviewed") if kind == "add" else ("red" if kind == "delete" else "white")
-        lines_table.add_row(
+        add_row(
             str(line.get("oldLine", "")),
             str(line.get("newLine", "")),
             kind,
-            Text(prefix + str(line.get("text", "")), style=style),
+            Text(_KIND_PREFIX.get(kind, "?") + str(line.get("text", "")), style=_KIND_STYLE.get(kind, "white")),
         )
     console.print(lines_table)
 
@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import argparse
 import re
-import shutil
 import sys
 from dataclasses import replace
 from pathlib import Path
@@ -17,10 +16,67 @@ from diffgr.agent_cli import (  # noqa: E402
     run_agent_cli,
     run_agent_cli_from_last_session,
     start_interactive_session,
+    which_command,
 )
 from diffgr.viewer_core import print_error, write_json  # noqa: E402
 
 
+def _copy_to_clipboard_windows(text: str) -> bool:
+    """Set the Windows clipboard through user32/kernel32 without spawning a shell.
+
+    Returns False when the Win32 API is unavailable or any call fails, so the
+    caller can fall back to PowerShell ``Set-Clipboard``.
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    except (AttributeError, ImportError, OSError, ValueError):
+        return False
+    kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree.restype = wintypes.HGLOBAL
+    user32.OpenClipboard.argtypes = [wintypes.HWND]
+    user32.OpenClipboard.restype = wintypes.BOOL
+    user32.EmptyClipboard.argtypes = []
+    user32.EmptyClipboard.restype = wintypes.BOOL
+    user32.CloseClipboard.argtypes = []
+    user32.CloseClipboard.restype = wintypes.BOOL
+    user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    user32.SetClipboardData.restype = wintypes.HANDLE
+
+    gmem_moveable = 0x0002
+    cf_unicodetext = 13
+    data = ctypes.create_unicode_buffer(text)
+    size = ctypes.sizeof(data)
+    handle = kernel32.GlobalAlloc(gmem_moveable, size)
+    if not handle:
+        return False
+    pointer = kernel32.GlobalLock(handle)
+    if not pointer:
+        kernel32.GlobalFree(handle)
+        return False
+    ctypes.memmove(pointer, data, size)
+    kernel32.GlobalUnlock(handle)
+    if not user32.OpenClipboard(None):
+        kernel32.GlobalFree(handle)
+        return False
+    try:
+        if not user32.EmptyClipboard() or not user32.SetClipboardData(cf_unicodetext, handle):
+            # Ownership only passes to the system on success.
+            kernel32.GlobalFree(handle)
+            return False
+    finally:
+        user32.CloseClipboard()
+    return True
+
+
 def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run Codex CLI or Claude Code CLI to produce a slice patch JSON.")
     parser.add_argument(
@@ -62,38 +118,40 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+_BACKTICK_RUN_RE = re.compile(r"`+")
+
+
 def _as_fenced_markdown_block(markdown_text: str) -> str:
     # Pick an outer fence longer than any fence already present in the text.
-    matches = re.findall(r"`+", markdown_text)
-    max_run = max((len(run) for run in matches), default=0)
+    max_run = max(map(len, _BACKTICK_RUN_RE.findall(markdown_text)), default=0)
     fence = "`" * max(3, max_run + 1)
     return f"{fence}markdown\n{markdown_text.strip()}\n{fence}\n"
 
 
+_SPLIT_MARKER_PATTERN = r"(前半|後半|前編|後編|part\s*\d+|第\s*[0-9一二三四五六七八九十]+\s*部)"
+_HALF_MARKER_RE = re.compile(r"(前半|後半|前編|後編)")
+_PART_MARKER_RE = re.compile(r"\bpart\s*\d+\b")
+_VOLUME_MARKER_RE = re.compile(r"第\s*[0-9一二三四五六七八九十]+\s*部")
+_GROUP_NAME_SPACES_RE = re.compile(r"[ 　]+")
+_BRACKETED_SPLIT_MARKER_RE = re.compile(
+    r"[\(\（][^\)\）]*" + _SPLIT_MARKER_PATTERN + r"[^\)\）]*[\)\）]",
+    re.IGNORECASE,
+)
+_TRAILING_SPLIT_MARKER_RE = re.compile(_SPLIT_MARKER_PATTERN + "$", re.IGNORECASE)
+
+
 def _has_split_marker_in_name(group_name: str) -> bool:
-    text = group_name.lower()
-    if re.search(r"(前半|後半|前編|後編)", group_name):
+    if _HALF_MARKER_RE.search(group_name):
         return True
-    if re.search(r"\bpart\s*\d+\b", text):
+    if _PART_MARKER_RE.search(group_name.lower()):
         return True
-    return bool(re.search(r"第\s*[0-9一二三四五六七八九十]+\s*部", group_name))
+    return bool(_VOLUME_MARKER_RE.search(group_name))
 
 
 def _normalize_group_name_for_split_guard(group_name: str) -> str:
-    normalized = re.sub(r"[ 　]+", "", group_name)
-    normalized = re.sub(
-        r"[\(\（][^\)\）]*(前半|後半|前編|後編|part\s*\d+|第\s*[0-9一二三四五六七八九十]+\s*部)[^\)\）]*[\)\）]",
-        "",
-        normalized,
-        flags=re.IGNORECASE,
-    )
-    normalized = re.sub(
-        r"(前半|後半|前編|後編|part\s*\d+|第\s*[0-9一二三四五六七八九十]+\s*部)$",
-        "",
-        normalized,
-        flags=re.IGNORECASE,
-    )
-    return normalized
+    normalized = _GROUP_NAME_SPACES_RE.sub("", group_name)
+    normalized = _BRACKETED_SPLIT_MARKER_RE.sub("", normalized)
+    return _TRAILING_SPLIT_MARKER_RE.sub("", normalized)
 
 
 def _find_split_name_conflicts(rename: dict[str, str]) -> list[str]:
@@ -259,7 +317,7 @@ def main(argv: list[str]) -> int:
     try:
         config = load_agent_cli_config(config_path)
         cli_command = config.codex_command if config.provider == "codex" else config.claude_command
-        resolved_cli_command = shutil.which(cli_command)
+        resolved_cli_command = which_command(cli_command)
         if resolved_cli_command is None:
             print(
                 f"[error] CLI command not found in PATH: {cli_command}. "
@@ -282,19 +340,25 @@ def main(argv: list[str]) -> int:
                 return 1
             do_copy = bool(args.copy_prompt) and not bool(args.no_copy_prompt)
             if do_copy and sys.platform.startswith("win"):
-                import subprocess
-
-                shell = shutil.which("powershell") or shutil.which("pwsh")
-                if shell is None:
-                    print("[warn] Clipboard copy skipped: neither powershell nor pwsh found in PATH.", file=sys.stderr)
-                else:
-                    subprocess.run(
-                        [shell, "-NoProfile", "-Command", "Set-Clipboard -Value ([Console]::In.ReadToEnd())"],
-                        input=prompt_markdown,
-                        text=True,
-                        capture_output=True,
-                    )
+                if _copy_to_clipboard_windows(prompt_markdown):
                     print(f"Copied prompt to clipboard: {prompt_path}")
+                else:
+                    import subprocess
+
+                    shell = which_command("powershell") or which_command("pwsh")
+                    if shell is None:
+                        print(
+                            "[warn] Clipboard copy skipped: neither powershell nor pwsh found in PATH.",
+                            file=sys.stderr,
+                        )
+                    else:
+                        subprocess.run(
+                            [shell, "-NoProfile", "-Command", "Set-Clipboard -Value ([Console]::In.ReadToEnd())"],
+                            input=prompt_markdown,
+                            text=True,
+                            capture_output=True,
+                        )
+                        print(f"Copied prompt to clipboard: {prompt_path}")
             note_path = _write_interactive_session_note(
                 repo=ROOT,
                 prompt_path=prompt_path,
@@ -2,16 +2,18 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import sys
 import threading
-import webbrowser
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Any, Callable
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from http.server import BaseHTTPRequestHandler
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -30,7 +32,13 @@ from diffgr.review_state import (  # noqa: E402
     review_state_fingerprint,
     save_review_state,
 )
-from diffgr.viewer_core import load_json, print_error, validate_document, write_json  # noqa: E402
+from diffgr.viewer_core import (  # noqa: E402
+    load_json,
+    print_error,
+    resolve_script_path,
+    validate_document,
+    write_json_atomic,
+)
 
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
@@ -52,7 +60,40 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
 
 
 def _iso_now() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _read_request_body(stream: Any, length: int) -> bytearray:
+    """Read up to *length* bytes into one preallocated buffer (short on early EOF)."""
+    buffer = bytearray(length)
+    view = memoryview(buffer)
+    received = 0
+    while received < length:
+        count = stream.readinto(view[received:])
+        if not count:
+            break
+        received += count
+    view.release()
+    if received < length:
+        del buffer[received:]
+    return buffer
+
+
+def _file_signature(path: Path | None) -> tuple[int, int] | None:
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {item.strip().removeprefix("W/") for item in header.split(",")}
+    return etag in candidates or "*" in candidates
 
 
 def _empty_review_state() -> dict[str, dict[str, Any]]:
@@ -63,23 +104,25 @@ def _normalize_state_payload(payload: Any) -> dict[str, dict[str, Any]]:
     return normalize_review_state_payload(payload)
 
 
-def save_review_state_to_document(path: Path, state: dict[str, Any]) -> dict[str, Any]:
+def save_review_state_to_document(
+    path: Path, state: dict[str, Any], *, saved_at: str | None = None
+) -> dict[str, Any]:
     doc = load_diffgr_document(path)
     review_state = normalize_review_state_payload(state)
     out = apply_review_state(doc, review_state)
-    write_json(path, out)
+    write_json_atomic(path, out)
     return {
         "savedTo": str(path),
-        "savedAt": _iso_now(),
+        "savedAt": saved_at or _iso_now(),
         "reviewChunkCount": len(review_state["reviews"]),
     }
 
 
-def save_review_state_to_file(path: Path, state: dict[str, Any]) -> dict[str, Any]:
+def save_review_state_to_file(path: Path, state: dict[str, Any], *, saved_at: str | None = None) -> dict[str, Any]:
     review_state = save_review_state(path, state)
     return {
         "savedTo": str(path),
-        "savedAt": _iso_now(),
+        "savedAt": saved_at or _iso_now(),
         "reviewChunkCount": len(review_state["reviews"]),
     }
 
@@ -93,6 +136,57 @@ class ServerState:
     group_selector: str = "all"
     report_title: str | None = None
     lock: threading.Lock = field(default_factory=threading.Lock)
+    _rendered: tuple[tuple[Any, ...], bytes, str] | None = field(default=None, init=False, repr=False)
+    _render_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _validated: dict[Path, tuple[int, int]] = field(default_factory=dict, init=False, repr=False)
+    _parsed: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = field(default_factory=dict, init=False, repr=False)
+
+    def _load_validated_json(self, path: Path) -> dict[str, Any]:
+        """Load *path*, validating it only if this exact file version has not passed before.
+
+        The parsed document is kept per path and reused while its (mtime, size) is unchanged,
+        so a re-render caused by another input (e.g. a --state save) does not re-parse it.
+        Callers must treat the returned document as read-only.
+        """
+        signature = _file_signature(path)
+        cached = self._parsed.get(path)
+        if signature is not None and cached is not None and cached[0] == signature:
+            return cached[1]
+        doc = load_json(path)
+        if signature is None or self._validated.get(path) != signature:
+            validate_document(doc)
+        if signature is not None:
+            self._validated[path] = signature
+            self._parsed[path] = (signature, doc)
+        return doc
+
+    def _input_signature(self) -> tuple[Any, ...]:
+        return tuple(
+            _file_signature(path)
+            for path in (self.source_path, self.state_path, self.impact_old_path, self.impact_state_path)
+        )
+
+    def render_html_bytes(self) -> bytes:
+        """Return the UTF-8 report, re-rendering only when an input file changed."""
+        return self.render_html_with_etag()[0]
+
+    def render_html_with_etag(self) -> tuple[bytes, str]:
+        cached = self._rendered
+        if cached is not None and cached[0] == self._input_signature():
+            return cached[1], cached[2]
+        # Concurrent requests that miss the cache wait for a single render instead of each rendering.
+        with self._render_lock:
+            key = self._input_signature()
+            cached = self._rendered
+            if cached is not None and cached[0] == key:
+                return cached[1], cached[2]
+            return self._render_and_cache(key)
+
+    def _render_and_cache(self, key: tuple[Any, ...]) -> tuple[bytes, str]:
+        raw = self.render_html().encode("utf-8")
+        etag = f'"{hashlib.blake2b(raw, digest_size=16).hexdigest()}"'
+        self._rendered = (key, raw, etag)
+        return raw, etag
 
     def render_html(self) -> str:
         if (
@@ -101,15 +195,13 @@ class ServerState:
             and self.state_path.resolve() != self.impact_state_path.resolve()
         ):
             raise RuntimeError("--state and --impact-state must point to the same state file.")
-        doc = load_json(self.source_path)
-        validate_document(doc)
+        doc = self._load_validated_json(self.source_path)
         impact_preview_payload = None
         impact_preview_report = None
         impact_preview_label = None
         impact_state_fingerprint = None
         if self.impact_old_path is not None and self.impact_state_path is not None:
-            old_doc = load_json(self.impact_old_path)
-            validate_document(old_doc)
+            old_doc = self._load_validated_json(self.impact_old_path)
             impact_state = load_review_state(self.impact_state_path)
             impact_preview_payload = preview_impact_merge(
                 old_doc=old_doc,
@@ -151,72 +243,82 @@ class ServerState:
             impact_state_fingerprint=impact_state_fingerprint,
         )
 
-    def save_state(self, state: dict[str, Any]) -> dict[str, Any]:
+    def save_state(self, state: dict[str, Any], *, saved_at: str | None = None) -> dict[str, Any]:
         with self.lock:
+            self._rendered = None
             if self.state_path is not None:
-                return save_review_state_to_file(self.state_path, state)
-            return save_review_state_to_document(self.source_path, state)
+                return save_review_state_to_file(self.state_path, state, saved_at=saved_at)
+            result = save_review_state_to_document(self.source_path, state, saved_at=saved_at)
+            # The parsed copy is stale even if (mtime, size) did not visibly change; the document
+            # was validated on load and only its state keys changed, so the next load skips that.
+            self._parsed.pop(self.source_path, None)
+            signature = _file_signature(self.source_path)
+            if signature is not None:
+                self._validated[self.source_path] = signature
+            return result
 
 
 def _handler_factory(state: ServerState) -> type[BaseHTTPRequestHandler]:
+    from http.server import BaseHTTPRequestHandler
+
     class Handler(BaseHTTPRequestHandler):
         server_version = "DiffgrReviewServer/1.0"
 
-        def _send_common_headers(self) -> None:
-            self.send_header("Cache-Control", "no-store")
+        def _send_common_headers(self, cache_control: str = "no-store") -> None:
+            self.send_header("Cache-Control", cache_control)
             self.send_header("Access-Control-Allow-Origin", "*")
             self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
             self.send_header("Access-Control-Allow-Headers", "Content-Type")
 
-        def _write_json(self, status: int, payload: dict[str, Any]) -> None:
-            raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        def _write_body(self, status: int, raw: bytes, content_type: str, *, etag: str | None = None) -> None:
             self.send_response(status)
-            self._send_common_headers()
-            self.send_header("Content-Type", "application/json; charset=utf-8")
+            if etag is None:
+                self._send_common_headers()
+            else:
+                # Revalidate on every load instead of no-store so the browser can send If-None-Match.
+                self._send_common_headers(cache_control="no-cache")
+                self.send_header("ETag", etag)
+            self.send_header("Content-Type", content_type)
             self.send_header("Content-Length", str(len(raw)))
             self.end_headers()
             self.wfile.write(raw)
 
-        def _write_html(self, html: str) -> None:
-            raw = html.encode("utf-8")
-            self.send_response(200)
-            self._send_common_headers()
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(raw)))
-            self.end_headers()
-            self.wfile.write(raw)
+        def _write_json(self, status: int, payload: dict[str, Any]) -> None:
+            raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self._write_body(status, raw, "application/json; charset=utf-8")
 
         def do_OPTIONS(self) -> None:  # noqa: N802
             self.send_response(204)
             self._send_common_headers()
             self.end_headers()
 
-        def do_GET(self) -> None:  # noqa: N802
-            path = urlparse(self.path).path
-            if path in {"/", "/index.html"}:
-                try:
-                    self._write_html(state.render_html())
-                except Exception as error:  # noqa: BLE001
-                    self._write_json(500, {"ok": False, "error": str(error)})
+        def _serve_html(self) -> None:
+            try:
+                raw, etag = state.render_html_with_etag()
+            except Exception as error:  # noqa: BLE001
+                self._write_json(500, {"ok": False, "error": str(error)})
                 return
-            if path == "/api/health":
-                self._write_json(
-                    200,
-                    {
-                        "ok": True,
-                        "sourcePath": str(state.source_path),
-                        "group": state.group_selector,
-                        "time": _iso_now(),
-                    },
-                )
+            if _etag_matches(self.headers.get("If-None-Match"), etag):
+                self.send_response(304)
+                self._send_common_headers(cache_control="no-cache")
+                self.send_header("ETag", etag)
+                self.end_headers()
                 return
-            self._write_json(404, {"ok": False, "error": f"Not found: {path}"})
+            self._write_body(200, raw, "text/html; charset=utf-8", etag=etag)
+
+        def _serve_health(self) -> None:
+            self._write_json(
+                200,
+                {
+                    "ok": True,
+                    "sourcePath": str(state.source_path),
+                    "group": state.group_selector,
+                    "time": _iso_now(),
+                },
+            )
 
-        def do_POST(self) -> None:  # noqa: N802
-            path = urlparse(self.path).path
-            if path != "/api/state":
-                self._write_json(404, {"ok": False, "error": f"Not found: {path}"})
-                return
+        def _serve_save_state(self) -> None:
+            saved_at = _iso_now()
             try:
                 length_raw = self.headers.get("Content-Length", "0")
                 length = int(length_raw)
@@ -229,16 +331,39 @@ def _handler_factory(state: ServerState) -> type[BaseHTTPRequestHandler]:
             if length > 20 * 1024 * 1024:
                 self._write_json(413, {"ok": False, "error": "Request body too large."})
                 return
-            raw = self.rfile.read(length)
+            raw = _read_request_body(self.rfile, length)
             try:
-                payload = json.loads(raw.decode("utf-8"))
+                payload = json.loads(raw)
                 review_state = _normalize_state_payload(payload)
-                result = state.save_state(review_state)
+                result = state.save_state(review_state, saved_at=saved_at)
             except Exception as error:  # noqa: BLE001
                 self._write_json(400, {"ok": False, "error": str(error)})
                 return
             self._write_json(200, {"ok": True, **result})
 
+        _GET_ROUTES: dict[str, Callable[[Any], None]] = {
+            "/": _serve_html,
+            "/index.html": _serve_html,
+            "/api/health": _serve_health,
+        }
+        _POST_ROUTES: dict[str, Callable[[Any], None]] = {
+            "/api/state": _serve_save_state,
+        }
+
+        def _dispatch(self, routes: dict[str, Callable[[Any], None]]) -> None:
+            path = urlsplit(self.path).path
+            route = routes.get(path)
+            if route is None:
+                self._write_json(404, {"ok": False, "error": f"Not found: {path}"})
+                return
+            route(self)
+
+        def do_GET(self) -> None:  # noqa: N802
+            self._dispatch(self._GET_ROUTES)
+
+        def do_POST(self) -> None:  # noqa: N802
+            self._dispatch(self._POST_ROUTES)
+
         def log_message(self, fmt: str, *args: Any) -> None:
             message = fmt % args
             print(f"[http] {self.address_string()} {message}")
@@ -248,36 +373,19 @@ def _handler_factory(state: ServerState) -> type[BaseHTTPRequestHandler]:
 
 def main(argv: list[str]) -> int:
     args = parse_args(argv)
-    source_path = Path(args.input)
-    if not source_path.is_absolute():
-        source_path = ROOT / source_path
-    source_path = source_path.resolve()
-    state_path = Path(args.state) if args.state else None
-    if state_path is not None and not state_path.is_absolute():
-        state_path = ROOT / state_path
-    if state_path is not None:
-        state_path = state_path.resolve()
-    impact_old_path = Path(args.impact_old) if args.impact_old else None
-    if impact_old_path is not None and not impact_old_path.is_absolute():
-        impact_old_path = ROOT / impact_old_path
-    if impact_old_path is not None:
-        impact_old_path = impact_old_path.resolve()
-    impact_state_path = Path(args.impact_state) if args.impact_state else None
-    if impact_state_path is not None and not impact_state_path.is_absolute():
-        impact_state_path = ROOT / impact_state_path
-    if impact_state_path is not None:
-        impact_state_path = impact_state_path.resolve()
-
-    if not source_path.exists():
-        print(f"[error] File not found: {source_path}", file=sys.stderr)
-        return 1
+    source_path = resolve_script_path(args.input, ROOT)
+    state_path = resolve_script_path(args.state, ROOT) if args.state else None
+    impact_old_path = resolve_script_path(args.impact_old, ROOT) if args.impact_old else None
+    impact_state_path = resolve_script_path(args.impact_state, ROOT) if args.impact_state else None
+
     if bool(impact_old_path) != bool(impact_state_path):
         print("[error] --impact-old and --impact-state must be provided together.", file=sys.stderr)
         return 1
-    if state_path is not None and impact_state_path is not None and state_path.resolve() != impact_state_path.resolve():
+    if state_path is not None and impact_state_path is not None and state_path != impact_state_path:
         print("[error] --state and --impact-state must point to the same state file.", file=sys.stderr)
         return 1
 
+    # A missing --input surfaces as load_json's "File not found" error, without a separate exists() check.
     try:
         doc = load_json(source_path)
         validate_document(doc)
@@ -298,6 +406,8 @@ def main(argv: list[str]) -> int:
         report_title=args.title,
         lock=threading.Lock(),
     )
+    from http.server import ThreadingHTTPServer
+
     handler = _handler_factory(state)
     server = ThreadingHTTPServer((args.host, args.port), handler)
     base_url = f"http://{args.host}:{args.port}/"
@@ -306,6 +416,8 @@ def main(argv: list[str]) -> int:
     print(f"Source : {source_path}")
     print(f"Group  : {args.group}")
     if args.open:
+        import webbrowser
+
         webbrowser.open(base_url)
 
     try:
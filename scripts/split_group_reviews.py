@@ -1,19 +1,34 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import argparse
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from diffgr.review_split import build_group_output_filename, split_document_by_group  # noqa: E402
-from diffgr.viewer_core import load_json, print_error, validate_document, write_json  # noqa: E402
+from diffgr.doc_cache import load_validated_document  # noqa: E402
+from diffgr.viewer_core import parse_simple_flags, print_error, resolve_script_path, write_json_atomic  # noqa: E402
+
 
+def parse_args(argv: list[str]) -> argparse.Namespace | SimpleNamespace:
+    fast = parse_simple_flags(
+        argv,
+        options={"--input": None, "--output-dir": None, "--manifest": "manifest.json"},
+        switches=("--include-empty",),
+        required=("--input", "--output-dir"),
+    )
+    if fast is not None:
+        return fast
+    import argparse
 
-def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Split one DiffGR file into per-group reviewer files.")
     parser.add_argument("--input", required=True, help="Input DiffGR JSON path.")
     parser.add_argument("--output-dir", required=True, help="Directory to write per-group DiffGR files.")
@@ -28,17 +43,14 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
 
 def main(argv: list[str]) -> int:
     args = parse_args(argv)
-    input_path = Path(args.input)
-    if not input_path.is_absolute():
-        input_path = ROOT / input_path
+    input_path = resolve_script_path(args.input, ROOT)
     output_dir = Path(args.output_dir)
     if not output_dir.is_absolute():
         output_dir = ROOT / output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        doc = load_json(input_path)
-        validate_document(doc)
+        doc = load_validated_document(input_path)
         split_items = split_document_by_group(doc, include_empty=bool(args.include_empty))
         manifest_items: list[dict[str, object]] = []
         for index, (group, group_doc) in enumerate(split_items, start=1):
@@ -46,7 +58,7 @@ def main(argv: list[str]) -> int:
             group_name = str(group.get("name", group_id))
             filename = build_group_output_filename(index, group_id, group_name)
             target = output_dir / filename
-            write_json(target, group_doc)
+            write_json_atomic(target, group_doc)
             manifest_items.append(
                 {
                     "groupId": group_id,
@@ -56,8 +68,8 @@ def main(argv: list[str]) -> int:
                 }
             )
         manifest_path = output_dir / str(args.manifest)
-        write_json(manifest_path, {
-            "source": str(input_path.resolve()),
+        write_json_atomic(manifest_path, {
+            "source": str(input_path),
             "fileCount": len(manifest_items),
             "files": manifest_items,
         })
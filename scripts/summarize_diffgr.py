@@ -1,19 +1,28 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import argparse
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from diffgr.summary import summarize_document  # noqa: E402
-from diffgr.viewer_core import load_json, print_error, print_json, validate_document  # noqa: E402
+from diffgr.doc_cache import load_validated_document  # noqa: E402
+from diffgr.viewer_core import parse_simple_flags, print_error, print_json, resolve_script_path  # noqa: E402
+
 
+def parse_args(argv: list[str]) -> argparse.Namespace | SimpleNamespace:
+    fast = parse_simple_flags(argv, options={"--input": None}, switches=("--json",), required=("--input",))
+    if fast is not None:
+        return fast
+    import argparse
 
-def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Summarize a DiffGR JSON (progress/coverage/source).")
     parser.add_argument("--input", required=True, help="Input DiffGR JSON path.")
     parser.add_argument("--json", action="store_true", help="Output JSON summary only.")
@@ -26,12 +35,11 @@ def _pct(value: float) -> str:
 
 def main(argv: list[str]) -> int:
     args = parse_args(argv)
-    input_path = Path(args.input)
-    if not input_path.is_absolute():
-        input_path = ROOT / input_path
+    from diffgr.summary import summarize_document
+
+    input_path = resolve_script_path(args.input, ROOT)
     try:
-        doc = load_json(input_path.resolve())
-        validate_document(doc)
+        doc = load_validated_document(input_path)
         summary = summarize_document(doc)
     except Exception as error:  # noqa: BLE001
         print_error(error)
@@ -54,18 +62,19 @@ def main(argv: list[str]) -> int:
     state = summary.get("state", {}) if isinstance(summary.get("state"), dict) else {}
     rate = float(review.get("CoverageRate", 0.0) or 0.0)
 
-    print(f"File: {input_path.resolve()}")
-    print(f"Title: {summary.get('title','')}")
+    lines: list[str] = []
+    lines.append(f"File: {input_path}")
+    lines.append(f"Title: {summary.get('title','')}")
     if summary.get("createdAt"):
-        print(f"CreatedAt: {summary.get('createdAt')}")
+        lines.append(f"CreatedAt: {summary.get('createdAt')}")
     if base or head:
-        print(f"Source: base={base} head={head}")
+        lines.append(f"Source: base={base} head={head}")
     if base_sha or head_sha or merge_base_sha:
-        print(f"SHA: baseSha={base_sha} headSha={head_sha} mergeBaseSha={merge_base_sha}")
-    print(f"Chunks: {summary.get('chunkCount',0)} Groups: {summary.get('groupCount',0)}")
+        lines.append(f"SHA: baseSha={base_sha} headSha={head_sha} mergeBaseSha={merge_base_sha}")
+    lines.append(f"Chunks: {summary.get('chunkCount',0)} Groups: {summary.get('groupCount',0)}")
 
     if cov:
-        print(
+        lines.append(
             "Coverage:"
             f" ok={bool(cov.get('ok'))}"
             f" unassigned={len(cov.get('unassigned') or [])}"
@@ -74,7 +83,7 @@ def main(argv: list[str]) -> int:
             f" unknownChunks={len(cov.get('unknown_chunks') or {})}"
         )
 
-    print(
+    lines.append(
         "Review:"
         f" tracked={review.get('Tracked',0)}"
         f" reviewed={review.get('Reviewed',0)}"
@@ -84,7 +93,7 @@ def main(argv: list[str]) -> int:
     )
     if briefs:
         brief_counts = briefs.get("statusCounts", {}) if isinstance(briefs.get("statusCounts"), dict) else {}
-        print(
+        lines.append(
             "Briefs:"
             f" total={briefs.get('total',0)}"
             f" draft={brief_counts.get('draft',0)}"
@@ -97,7 +106,7 @@ def main(argv: list[str]) -> int:
         detail = str(state.get("chunkDetailViewMode", "") or "-")
         filter_text = str(state.get("filterText", "") or "")
         filter_label = filter_text if filter_text else "-"
-        print(
+        lines.append(
             "State:"
             f" analysis={bool(state.get('hasAnalysisState'))}"
             f" thread={bool(state.get('hasThreadState'))}"
@@ -112,8 +121,8 @@ def main(argv: list[str]) -> int:
             f" lineAnchor={bool(state.get('hasSelectedLineAnchor'))}"
         )
 
-    print("")
-    print("Groups:")
+    lines.append("")
+    lines.append("Groups:")
     for group in summary.get("groups", []) or []:
         if not isinstance(group, dict):
             continue
@@ -124,9 +133,11 @@ def main(argv: list[str]) -> int:
         total = int(group.get("total", 0) or 0)
         rate_group = float(group.get("rate", 0.0) or 0.0)
         brief_status = str(group.get("briefStatus", "none"))
-        print(
+        lines.append(
             f"- {gid} {name}: reviewed={reviewed}/{tracked}({_pct(rate_group)}) total={total} brief={brief_status}"
         )
+    # One write instead of a print (and stdout lock/flush) per line keeps large group lists cheap.
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
@@ -0,0 +1,8 @@
+"""Serialization shared by tests that hand DiffGR documents to scripts through files."""
+
+import json
+
+
+def dump_doc(doc: dict) -> str:
+    """Compact JSON text for *doc*; write it with ``encoding="utf-8"``."""
+    return json.dumps(doc, ensure_ascii=False, separators=(",", ":"))
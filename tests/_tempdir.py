@@ -0,0 +1,20 @@
+"""Class-scoped temporary directory for test cases that write files."""
+
+import tempfile
+from pathlib import Path
+
+
+class ClassTempDirMixin:
+    """Mix into a ``unittest.TestCase``: one temporary root per class, one subdirectory per test."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls._tmp_root = Path(tmp.name)
+
+    def _make_test_dir(self) -> Path:
+        path = self._tmp_root / self._testMethodName
+        path.mkdir()
+        return path
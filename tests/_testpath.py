@@ -0,0 +1,13 @@
+"""Put the repository root on ``sys.path`` once per process.
+
+Imported as ``from tests import _testpath`` by test modules that load
+``diffgr``/``scripts``; run them from the repository root with pytest,
+``python -m unittest discover`` or ``python -m unittest tests.test_<name>``.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
@@ -1,7 +1,10 @@
+import sys
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
+from diffgr import agent_cli
 from diffgr.agent_cli import (
     AgentCliConfig,
     extract_first_json_object,
@@ -13,6 +16,9 @@ from diffgr.agent_cli import (
 
 
 class TestAgentCli(unittest.TestCase):
+    def setUp(self):
+        agent_cli._resolve_command.cache_clear()
+
     def test_extract_first_json_object_parses_plain_json(self):
         obj = extract_first_json_object('{"rename": {"g1": "計算"}, "move": []}')
         self.assertEqual(obj["rename"]["g1"], "計算")
@@ -21,6 +27,12 @@ class TestAgentCli(unittest.TestCase):
         obj = extract_first_json_object("note: ok\n{\"rename\": {}, \"move\": [{\"chunk\":\"c1\",\"to\":\"g1\"}]}\n")
         self.assertEqual(obj["move"][0]["chunk"], "c1")
 
+    def test_extract_first_json_object_skips_unparseable_braces(self):
+        obj = extract_first_json_object('log {not json} then {"rename": {"g1": "x"}, "move": []} trailer')
+        self.assertEqual(obj, {"rename": {"g1": "x"}, "move": []})
+        with self.assertRaises(RuntimeError):
+            extract_first_json_object("no object {here")
+
     def test_run_agent_cli_builds_commands(self):
         repo = Path(".").resolve()
         prompt = "# prompt"
@@ -152,6 +164,27 @@ class TestAgentCli(unittest.TestCase):
             self.assertIn("--last", args[0])
             self.assertNotIn("--output-last-message", args[0])
 
+    def test_resolve_command_is_cached_per_path(self):
+        with patch("diffgr.agent_cli.shutil.which", return_value="/usr/bin/codex") as which:
+            with patch.dict("os.environ", {"PATH": "/usr/bin"}):
+                self.assertEqual(agent_cli._resolve_command_for_subprocess("codex"), "/usr/bin/codex")
+                self.assertEqual(agent_cli._resolve_command_for_subprocess("codex"), "/usr/bin/codex")
+                self.assertEqual(which.call_count, 1)
+            with patch.dict("os.environ", {"PATH": "/opt/bin"}):
+                agent_cli._resolve_command_for_subprocess("codex")
+                self.assertEqual(which.call_count, 2)
+
+    def test_which_command_re_resolves_when_path_changes(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            tool = Path(tempdir) / ("diffgr-which-probe.exe" if sys.platform.startswith("win") else "diffgr-which-probe")
+            tool.write_text("#!/bin/sh\n", encoding="utf-8")
+            tool.chmod(0o755)
+            with patch.dict("os.environ", {"PATH": "", "PATHEXT": ".EXE"}):
+                self.assertIsNone(agent_cli.which_command(tool.stem))
+            with patch.dict("os.environ", {"PATH": tempdir, "PATHEXT": ".EXE"}):
+                found = agent_cli.which_command(tool.stem)
+        self.assertIsNotNone(found)
+
     def test_start_interactive_session_uses_resolved_command_path(self):
         repo = Path(".").resolve()
         resolved = r"C:\tools\codex.cmd"
@@ -1,16 +1,13 @@
 import io
 import json
-import sys
 import tempfile
 import unittest
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from tests import _testpath  # noqa: F401
 
-from scripts.apply_diffgr_layout import apply_layout, main  # noqa: E402
+from scripts.apply_diffgr_layout import apply_layout, main
 
 
 def make_doc() -> dict:
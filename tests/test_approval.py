@@ -4,17 +4,14 @@ from __future__ import annotations
 import copy
 import io
 import json
-import sys
 import tempfile
 import unittest
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from tests import _testpath  # noqa: F401
 
-from diffgr.approval import (  # noqa: E402
+from diffgr.approval import (
     REASON_APPROVED,
     REASON_CHANGES_REQUESTED,
     REASON_INVALIDATED_CODE_CHANGE,
@@ -32,9 +29,9 @@ from diffgr.approval import (  # noqa: E402
     request_changes_on_group,
     revoke_group_approval,
 )
-from scripts.approve_virtual_pr import main as approve_main  # noqa: E402
-from scripts.check_virtual_pr_approval import main as check_main  # noqa: E402
-from scripts.request_changes import main as request_changes_main  # noqa: E402
+from scripts.approve_virtual_pr import main as approve_main
+from scripts.check_virtual_pr_approval import main as check_main
+from scripts.request_changes import main as request_changes_main
 
 
 # ---------------------------------------------------------------------------
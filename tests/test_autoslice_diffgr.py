@@ -1,4 +1,4 @@
-import json
+import copy
 import tempfile
 import unittest
 from pathlib import Path
@@ -98,9 +98,10 @@ index 1111111..2222222 100644
             # base is an ancestor of feature in this test repo, so merge-base == base.
             self.assertEqual(source.get("mergeBaseSha"), base)
 
+            original = copy.deepcopy(doc)
             new_doc, warnings = autoslice_document_by_commits(
                 repo=repo,
-                doc=json.loads(json.dumps(doc)),
+                doc=doc,
                 base_ref=base,
                 feature_ref=feature,
                 max_commits=10,
@@ -113,6 +114,7 @@ index 1111111..2222222 100644
             for ids in new_doc["assignments"].values():
                 assigned.update(ids)
             self.assertEqual(assigned, {c["id"] for c in doc["chunks"]})
+            self.assertEqual(doc, original)
 
     def test_autoslice_warns_when_commit_history_is_truncated(self):
         with tempfile.TemporaryDirectory() as tmp:
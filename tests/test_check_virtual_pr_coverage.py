@@ -1,16 +1,12 @@
 import io
-import json
-import sys
-import tempfile
 import unittest
-from contextlib import redirect_stderr, redirect_stdout
-from pathlib import Path
+from contextlib import ExitStack, redirect_stderr, redirect_stdout
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from tests import _testpath  # noqa: F401
+from tests._docs import dump_doc
+from tests._tempdir import ClassTempDirMixin
 
-from scripts.check_virtual_pr_coverage import main as check_main  # noqa: E402
+from scripts.check_virtual_pr_coverage import main as check_main
 
 
 def make_doc() -> dict:
@@ -31,40 +27,44 @@ def make_doc() -> dict:
     }
 
 
-class TestCheckVirtualPrCoverage(unittest.TestCase):
+class TestCheckVirtualPrCoverage(ClassTempDirMixin, unittest.TestCase):
+    def setUp(self):
+        # Capture check_main's console output once per test.
+        self.output = io.StringIO()
+        stack = ExitStack()
+        stack.enter_context(redirect_stdout(self.output))
+        stack.enter_context(redirect_stderr(self.output))
+        self.addCleanup(stack.close)
+
     def test_ok_returns_zero(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "doc.diffgr.json"
-            path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
-                code = check_main(["--input", str(path)])
+        path = self._make_test_dir() / "doc.diffgr.json"
+        path.write_text(dump_doc(make_doc()), encoding="utf-8")
+        code = check_main(["--input", str(path)])
         self.assertEqual(code, 0)
+        self.assertIn("Unassigned: 0", self.output.getvalue())
 
     def test_unassigned_returns_two_and_writes_prompt(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            path = root / "doc.diffgr.json"
-            doc = make_doc()
-            doc["assignments"] = {"g1": ["c1"]}  # c2 missing
-            path.write_text(json.dumps(doc, ensure_ascii=False), encoding="utf-8")
-            prompt_path = root / "prompt.md"
-            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
-                code = check_main(["--input", str(path), "--write-prompt", str(prompt_path)])
-            self.assertEqual(code, 2)
-            self.assertTrue(prompt_path.exists())
-            prompt = prompt_path.read_text(encoding="utf-8")
-            self.assertIn("Unassigned chunks", prompt)
-            self.assertIn("c2", prompt)
+        root = self._make_test_dir()
+        path = root / "doc.diffgr.json"
+        doc = make_doc()
+        doc["assignments"] = {"g1": ["c1"]}  # c2 missing
+        path.write_text(dump_doc(doc), encoding="utf-8")
+        prompt_path = root / "prompt.md"
+        code = check_main(["--input", str(path), "--write-prompt", str(prompt_path)])
+        self.assertEqual(code, 2)
+        self.assertTrue(prompt_path.exists())
+        prompt = prompt_path.read_text(encoding="utf-8")
+        self.assertIn("Unassigned chunks", prompt)
+        self.assertIn("c2", prompt)
 
     def test_duplicate_returns_two(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "doc.diffgr.json"
-            doc = make_doc()
-            doc["assignments"]["g2"].append("c1")  # duplicate assignment
-            path.write_text(json.dumps(doc, ensure_ascii=False), encoding="utf-8")
-            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
-                code = check_main(["--input", str(path), "--json"])
+        path = self._make_test_dir() / "doc.diffgr.json"
+        doc = make_doc()
+        doc["assignments"]["g2"].append("c1")  # duplicate assignment
+        path.write_text(dump_doc(doc), encoding="utf-8")
+        code = check_main(["--input", str(path), "--json"])
         self.assertEqual(code, 2)
+        self.assertIn('"c1"', self.output.getvalue())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,126 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from tests import _testpath  # noqa: F401
+
+from diffgr import doc_cache
+from diffgr.doc_cache import document_cache_dir, load_document_with_warnings, load_validated_document
+
+
+def make_doc(title: str = "UT Cache") -> dict:
+    return {
+        "format": "diffgr",
+        "version": 1,
+        "meta": {"title": title, "createdAt": "2026-02-22T00:00:00Z"},
+        "groups": [{"id": "g1", "name": "G1", "order": 1}],
+        "chunks": [{"id": "c1", "filePath": "src/a.ts", "lines": []}],
+        "assignments": {"g1": ["c1"]},
+        "reviews": {},
+    }
+
+
+class TestDocCache(unittest.TestCase):
+    def test_document_cache_dir_honours_env(self):
+        with patch.dict(os.environ, {"DIFFGR_CACHE_DIR": "/tmp/diffgr-cache"}):
+            self.assertEqual(document_cache_dir(), Path("/tmp/diffgr-cache"))
+        with patch.dict(os.environ, {"DIFFGR_CACHE_DIR": ""}):
+            self.assertIsNone(document_cache_dir())
+
+    def test_load_validated_document_reuses_entry_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            cache_dir = Path(tempdir) / "cache"
+            path = Path(tempdir) / "doc.diffgr.json"
+            path.write_text(json.dumps(make_doc()), encoding="utf-8")
+            with patch.dict(os.environ, {"DIFFGR_CACHE_DIR": str(cache_dir)}):
+                first = load_validated_document(path)
+                self.assertEqual(len(list(cache_dir.glob("*.json"))), 1)
+                with patch("diffgr.doc_cache.load_json") as load_json:
+                    self.assertEqual(load_validated_document(path), first)
+                    load_json.assert_not_called()
+                path.write_text(json.dumps(make_doc("UT Cache (edited)")), encoding="utf-8")
+                os.utime(path, ns=(1, 1))
+                updated = load_validated_document(path)
+                self.assertEqual(len(list(cache_dir.glob("*.json"))), 1)
+            self.assertEqual(updated["meta"]["title"], "UT Cache (edited)")
+
+    def test_load_document_with_warnings_caches_warnings(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = Path(tempdir) / "doc.diffgr.json"
+            doc = make_doc()
+            doc["reviews"]["ghost"] = {"status": "reviewed"}
+            path.write_text(json.dumps(doc), encoding="utf-8")
+            with patch.dict(os.environ, {"DIFFGR_CACHE_DIR": str(Path(tempdir) / "cache")}):
+                _doc, warnings = load_document_with_warnings(path)
+                with patch("diffgr.doc_cache.validate_document") as validate:
+                    _doc, cached_warnings = load_document_with_warnings(path)
+                    validate.assert_not_called()
+            self.assertEqual(warnings, ["Review key chunk id not found: ghost"])
+            self.assertEqual(cached_warnings, warnings)
+
+    def test_cache_entries_are_versioned_owner_only_and_capped(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            cache_dir = Path(tempdir) / "cache"
+            paths = [Path(tempdir) / f"doc{index}.diffgr.json" for index in range(3)]
+            for path in paths:
+                path.write_text(json.dumps(make_doc()), encoding="utf-8")
+            with patch.dict(os.environ, {"DIFFGR_CACHE_DIR": str(cache_dir)}), patch.object(doc_cache, "_MAX_ENTRIES", 2):
+                load_validated_document(paths[0])
+                entries = list(cache_dir.glob("*.json"))
+                self.assertEqual(len(entries), 1)
+                self.assertIn(f"-v{doc_cache._CACHE_VERSION}-", entries[0].name)
+                if os.name == "posix":
+                    self.assertEqual(cache_dir.stat().st_mode & 0o777, 0o700)
+                with patch.object(doc_cache, "_CACHE_VERSION", doc_cache._CACHE_VERSION + 1):
+                    with patch("diffgr.doc_cache.load_json", wraps=doc_cache.load_json) as load_json:
+                        load_validated_document(paths[0])
+                        load_json.assert_called_once()
+                for path in paths[1:]:
+                    load_validated_document(path)
+                self.assertEqual(len(list(cache_dir.glob(f"*-v{doc_cache._CACHE_VERSION}-*.json"))), 2)
+
+    def test_prune_keeps_files_that_are_not_cache_entries(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            cache_dir = Path(tempdir) / "cache"
+            cache_dir.mkdir(mode=0o700)
+            unrelated = [cache_dir / "notes.json", cache_dir / "state.pkl"]
+            for other in unrelated:
+                other.write_text("{}", encoding="utf-8")
+            path = Path(tempdir) / "doc.diffgr.json"
+            path.write_text(json.dumps(make_doc()), encoding="utf-8")
+            with patch.dict(os.environ, {"DIFFGR_CACHE_DIR": str(cache_dir)}), patch.object(doc_cache, "_MAX_ENTRIES", 0):
+                load_validated_document(path)
+            self.assertTrue(all(other.exists() for other in unrelated))
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "POSIX permissions only")
+    def test_writable_by_others_cache_is_not_trusted(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            cache_dir = Path(tempdir) / "cache"
+            path = Path(tempdir) / "doc.diffgr.json"
+            path.write_text(json.dumps(make_doc()), encoding="utf-8")
+            with patch.dict(os.environ, {"DIFFGR_CACHE_DIR": str(cache_dir)}):
+                load_validated_document(path)
+                (entry,) = cache_dir.glob("*.json")
+                self.assertEqual(entry.stat().st_mode & 0o777, 0o600)
+                entry.write_text(json.dumps([make_doc("forged"), []]), encoding="utf-8")
+                entry.chmod(0o666)
+                self.assertEqual(load_validated_document(path)["meta"]["title"], "UT Cache")
+                entry.chmod(0o600)
+                cache_dir.chmod(0o777)
+                self.assertEqual(load_validated_document(path)["meta"]["title"], "UT Cache")
+                cache_dir.chmod(0o700)
+
+    def test_load_validated_document_without_cache_still_validates(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = Path(tempdir) / "doc.diffgr.json"
+            path.write_text(json.dumps({"format": "diffgr"}), encoding="utf-8")
+            with patch.dict(os.environ, {"DIFFGR_CACHE_DIR": ""}):
+                with self.assertRaises(RuntimeError):
+                    load_validated_document(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,20 +1,23 @@
-import sys
 import unittest
-from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from tests import _testpath  # noqa: F401
 
 from diffgr import generator as generate_diffgr
 
 
+_NORMALIZE_CASES = (
+    ("a/src/app.ts", "src/app.ts"),
+    ("b/src/app.ts", "src/app.ts"),
+    ("/dev/null", None),
+    ("src/app.ts", "src/app.ts"),
+)
+
+
 class TestGenerateDiffgr(unittest.TestCase):
     def test_normalize_diff_path(self):
-        self.assertEqual(generate_diffgr.normalize_diff_path("a/src/app.ts"), "src/app.ts")
-        self.assertEqual(generate_diffgr.normalize_diff_path("b/src/app.ts"), "src/app.ts")
-        self.assertIsNone(generate_diffgr.normalize_diff_path("/dev/null"))
-        self.assertEqual(generate_diffgr.normalize_diff_path("src/app.ts"), "src/app.ts")
+        for raw, expected in _NORMALIZE_CASES:
+            with self.subTest(raw=raw):
+                self.assertEqual(generate_diffgr.normalize_diff_path(raw), expected)
 
     def test_parse_unified_diff_with_hunk_and_meta_line(self):
         diff_text = "\n".join(
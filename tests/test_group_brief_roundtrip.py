@@ -1,15 +1,11 @@
 from __future__ import annotations
 
-import sys
 import unittest
-from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from tests import _testpath  # noqa: F401
 
-from diffgr.group_brief_utils import merge_group_brief_payload, normalize_group_brief_record  # noqa: E402
-from diffgr.html_report import _normalize_group_brief, _render_group_approval_summary  # noqa: E402
+from diffgr.group_brief_utils import merge_group_brief_payload, normalize_group_brief_record
+from diffgr.html_report import _normalize_group_brief, _render_group_approval_summary
 
 
 class TestGroupBriefUtilities(unittest.TestCase):
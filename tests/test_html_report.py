@@ -1,39 +1,35 @@
 import json
-import sys
-import tempfile
+import re
 import unittest
-from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from tests import _testpath  # noqa: F401
+from tests._tempdir import ClassTempDirMixin
 
 from diffgr.html_report import render_group_diff_html
 from scripts.export_diffgr_html import main as export_html_main
 
 
-def extract_report_doc_json(html: str) -> dict:
-    marker = '<script id="report-doc-json" type="application/json">'
-    start = html.find(marker)
-    if start < 0:
-        raise AssertionError("embedded report-doc-json script not found")
-    end = html.find("</script>", start)
-    if end < 0:
-        raise AssertionError("embedded report-doc-json script is not closed")
-    payload = html[start + len(marker) : end]
+_EMBEDDED_JSON_RE = re.compile(r'<script id="([^"]+)-json" type="application/json">(.*?)</script>', re.DOTALL)
+
+
+def extract_embedded_json(html: str) -> dict[str, str]:
+    """Raw payloads of every ``<script id="...-json">`` block, keyed by id without the suffix."""
+    return {match.group(1): match.group(2) for match in _EMBEDDED_JSON_RE.finditer(html)}
+
+
+def _extract_embedded(html: str, name: str) -> dict:
+    payload = extract_embedded_json(html).get(name)
+    if payload is None:
+        raise AssertionError(f"embedded {name}-json script not found")
     return json.loads(payload)
 
 
+def extract_report_doc_json(html: str) -> dict:
+    return _extract_embedded(html, "report-doc")
+
+
 def extract_report_config_json(html: str) -> dict:
-    marker = '<script id="report-config-json" type="application/json">'
-    start = html.find(marker)
-    if start < 0:
-        raise AssertionError("embedded report-config-json script not found")
-    end = html.find("</script>", start)
-    if end < 0:
-        raise AssertionError("embedded report-config-json script is not closed")
-    payload = html[start + len(marker) : end]
-    return json.loads(payload)
+    return _extract_embedded(html, "report-config")
 
 
 def make_doc() -> dict:
@@ -91,9 +87,87 @@ def make_doc() -> dict:
     }
 
 
-class TestHtmlReport(unittest.TestCase):
+class TestHtmlReport(ClassTempDirMixin, unittest.TestCase):
+    _SCRIPT_HOOK_NEEDLES = (
+        'id="stat-reviewed-rate"',
+        'id="save-state"',
+        'id="download-json"',
+        'id="download-state"',
+        'id="import-state"',
+        'id="diff-state"',
+        'id="apply-state-selection"',
+        'id="import-state-file"',
+        'id="copy-state"',
+        'id="state-source-label"',
+        'id="state-selection-modal"',
+        'id="comment-editor-modal"',
+        "data-action='toggle-reviewed'",
+        "data-action='chunk-comment'",
+        "data-action='line-comment'",
+        "data-action='edit-comment-item'",
+        "function openCommentEditor(options)",
+        "function setChunkStatus(",
+        "function refreshReviewProgress()",
+        "setSaveStatus(",
+        "function setChunkComment(",
+        "function setLineCommentForAnchor(",
+        "function editCommentItemFromPane(commentItemEl)",
+        "function rebuildCommentPaneFromDraft()",
+        "function rebuildInboxFromDom()",
+        "function currentStatePayload()",
+        "function normalizeImportedStatePayload(",
+        "function cloneStateValue(",
+        "function canonicalStateValue(",
+        "function canonicalStateString(",
+        "function applyImportedState(",
+        "updateImpactPlanActions();",
+        "function parseSelectionTokens(",
+        "function collectSelectableTokens(",
+        "function diffStatePayload(",
+        "function applySelectedStateTokens(",
+        'const stateDiffSections = ["reviews", "groupBriefs", "analysisState", "threadState"];',
+        'const stateSelectionSections = ["reviews", "groupBriefs", "analysisState", "threadState", "threadState.__files"];',
+        "function createEmptyDiffSection()",
+        "threadState.__files:${fileKey}",
+        "Object.keys(value).sort()",
+        "for (const sectionName of stateDiffSections)",
+        "Object.fromEntries(stateSelectionSections.map((section) => [section, []]))",
+        "Object.fromEntries(stateSelectionSections.map((section) => [section, new Set()]))",
+        "addedCount",
+        '" [select: " + token + "]"',
+        "function refreshChunkVisualsFromDraft()",
+    )
+
+    # Shared read-only fixture; tests that edit the document build their own via make_doc().
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.doc = make_doc()
+        cls.doc_json = json.dumps(cls.doc, ensure_ascii=False, separators=(",", ":"))
+        cls.doc_bytes = cls.doc_json.encode("utf-8")
+        # Most render tests only inspect the default single-group page; render it once.
+        cls.group_html = render_group_diff_html(cls.doc, group_selector="計算倍率変更")
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        # The fixture is shared by reference (a MappingProxyType/tuple freeze would break the
+        # json.dumps inside the renderer), so catch any test that mutated it.
+        if json.dumps(cls.doc, ensure_ascii=False, separators=(",", ":")) != cls.doc_json:
+            raise AssertionError("TestHtmlReport.doc was mutated; use make_doc() for tests that edit the document")
+
+    def assertContainsAll(self, html: str, needles: tuple[str, ...]) -> None:
+        missing = [needle for needle in needles if needle not in html]
+        self.assertFalse(missing, f"missing from rendered HTML: {missing}")
+
+    def test_render_does_not_mutate_input_doc(self):
+        doc = make_doc()
+        for selector in ("計算倍率変更", "unassigned", "all"):
+            render_group_diff_html(doc, group_selector=selector, save_state_url="/api/state")
+        self.assertEqual(doc, make_doc())
+
     def test_render_group_diff_html_by_japanese_name(self):
-        html = render_group_diff_html(make_doc(), group_selector="計算倍率変更")
+        html = self.group_html
         self.assertIn("Group: <b>計算倍率変更</b>", html)
         self.assertIn("data-file='src/a.ts'", html)
         self.assertNotIn("data-file='src/b.ts'", html)
@@ -110,7 +184,7 @@ class TestHtmlReport(unittest.TestCase):
             render_group_diff_html(doc, group_selector="同名")
 
     def test_render_group_diff_html_unassigned_selector(self):
-        html = render_group_diff_html(make_doc(), group_selector="unassigned")
+        html = render_group_diff_html(self.doc, group_selector="unassigned")
         self.assertIn("Group: <b>Unassigned</b>", html)
         self.assertIn("data-file='src/c.ts'", html)
         self.assertNotIn("data-file='src/a.ts'", html)
@@ -124,60 +198,11 @@ class TestHtmlReport(unittest.TestCase):
         self.assertEqual([chunk.get("id") for chunk in embedded.get("chunks", [])], ["c1", "c2", "c3"])
 
     def test_render_includes_html_comment_posting_controls_and_script_hooks(self):
-        html = render_group_diff_html(make_doc(), group_selector="計算倍率変更")
-        self.assertIn('id="stat-reviewed-rate"', html)
-        self.assertIn('id="save-state"', html)
-        self.assertIn('id="download-json"', html)
-        self.assertIn('id="download-state"', html)
-        self.assertIn('id="import-state"', html)
-        self.assertIn('id="diff-state"', html)
-        self.assertIn('id="apply-state-selection"', html)
-        self.assertIn('id="import-state-file"', html)
-        self.assertIn('id="copy-state"', html)
-        self.assertIn('id="state-source-label"', html)
-        self.assertIn('id="state-selection-modal"', html)
-        self.assertIn('id="comment-editor-modal"', html)
-        self.assertIn("data-action='toggle-reviewed'", html)
-        self.assertIn("data-action='chunk-comment'", html)
-        self.assertIn("data-action='line-comment'", html)
-        self.assertIn("data-action='edit-comment-item'", html)
-        self.assertIn("function openCommentEditor(options)", html)
-        self.assertIn("function setChunkStatus(", html)
-        self.assertIn("function refreshReviewProgress()", html)
-        self.assertIn("setSaveStatus(", html)
-        self.assertIn("function setChunkComment(", html)
-        self.assertIn("function setLineCommentForAnchor(", html)
-        self.assertIn("function editCommentItemFromPane(commentItemEl)", html)
-        self.assertIn("function rebuildCommentPaneFromDraft()", html)
-        self.assertIn("function rebuildInboxFromDom()", html)
-        self.assertIn("function currentStatePayload()", html)
-        self.assertIn("function normalizeImportedStatePayload(", html)
-        self.assertIn("function cloneStateValue(", html)
-        self.assertIn("function canonicalStateValue(", html)
-        self.assertIn("function canonicalStateString(", html)
-        self.assertIn("function applyImportedState(", html)
-        self.assertIn("updateImpactPlanActions();", html)
-        self.assertIn("function parseSelectionTokens(", html)
-        self.assertIn("function collectSelectableTokens(", html)
-        self.assertIn("function diffStatePayload(", html)
-        self.assertIn("function applySelectedStateTokens(", html)
-        self.assertIn('const stateDiffSections = ["reviews", "groupBriefs", "analysisState", "threadState"];', html)
-        self.assertIn(
-            'const stateSelectionSections = ["reviews", "groupBriefs", "analysisState", "threadState", "threadState.__files"];',
-            html,
-        )
-        self.assertIn("function createEmptyDiffSection()", html)
-        self.assertIn("threadState.__files:${fileKey}", html)
-        self.assertIn("Object.keys(value).sort()", html)
-        self.assertIn("for (const sectionName of stateDiffSections)", html)
-        self.assertIn("Object.fromEntries(stateSelectionSections.map((section) => [section, []]))", html)
-        self.assertIn("Object.fromEntries(stateSelectionSections.map((section) => [section, new Set()]))", html)
-        self.assertIn("addedCount", html)
-        self.assertIn('" [select: " + token + "]"', html)
-        self.assertIn("function refreshChunkVisualsFromDraft()", html)
+        html = self.group_html
+        self.assertContainsAll(html, self._SCRIPT_HOOK_NEEDLES)
 
     def test_render_includes_line_anchor_data_attributes_for_line_commenting(self):
-        html = render_group_diff_html(make_doc(), group_selector="計算倍率変更")
+        html = self.group_html
         self.assertIn("data-anchor-key='delete:2:'", html)
         self.assertIn("data-old-line='2' data-new-line=''", html)
         self.assertIn("data-anchor-key='add::2'", html)
@@ -196,13 +221,18 @@ class TestHtmlReport(unittest.TestCase):
             }
         }
         html = render_group_diff_html(doc, group_selector="計算倍率変更")
-        self.assertIn("chunk note", html)
-        self.assertIn("line note", html)
-        self.assertIn('id="stat-comments-total" class="v">2</span>', html)
-        self.assertIn('id="comment-total">2</span>', html)
-        self.assertIn('id="comment-unresolved">2</span>', html)
-        self.assertIn("data-kind='line-comment' data-anchor-key='delete:2:'", html)
-        self.assertIn("data-chunk-id='c1' data-anchor-key='delete:2:'", html)
+        self.assertContainsAll(
+            html,
+            (
+                "chunk note",
+                "line note",
+                'id="stat-comments-total" class="v">2</span>',
+                'id="comment-total">2</span>',
+                'id="comment-unresolved">2</span>',
+                "data-kind='line-comment' data-anchor-key='delete:2:'",
+                "data-chunk-id='c1' data-anchor-key='delete:2:'",
+            ),
+        )
 
     def test_render_comment_items_include_edit_anchor_metadata(self):
         doc = make_doc()
@@ -234,7 +264,7 @@ class TestHtmlReport(unittest.TestCase):
         self.assertIn('id="stat-reviewed-rate">100</span>', html)
 
     def test_render_embeds_save_config_defaults(self):
-        html = render_group_diff_html(make_doc(), group_selector="計算倍率変更")
+        html = self.group_html
         config = extract_report_config_json(html)
         self.assertEqual(config.get("saveStateUrl"), "")
         self.assertEqual(config.get("saveStateLabel"), "Save State")
@@ -243,7 +273,7 @@ class TestHtmlReport(unittest.TestCase):
 
     def test_render_embeds_save_config_when_url_is_provided(self):
         html = render_group_diff_html(
-            make_doc(),
+            self.doc,
             group_selector="計算倍率変更",
             save_state_url="/api/state",
             save_state_label="Sync",
@@ -255,7 +285,7 @@ class TestHtmlReport(unittest.TestCase):
 
     def test_render_embeds_overlay_state_source(self):
         html = render_group_diff_html(
-            make_doc(),
+            self.doc,
             group_selector="計算倍率変更",
             state_source_label="review.state.json",
         )
@@ -263,7 +293,7 @@ class TestHtmlReport(unittest.TestCase):
         self.assertEqual(config.get("stateSourceLabel"), "overlay:review.state.json")
 
     def test_render_impact_preview_panel_only_when_payload_is_present(self):
-        html = render_group_diff_html(make_doc(), group_selector="計算倍率変更")
+        html = self.group_html
         self.assertNotIn("Impact Preview", html)
 
         payload = {
@@ -299,7 +329,7 @@ class TestHtmlReport(unittest.TestCase):
             ],
         }
         html = render_group_diff_html(
-            make_doc(),
+            self.doc,
             group_selector="計算倍率変更",
             impact_preview_payload=payload,
             impact_preview_label="old.diffgr.json -> new.diffgr.json using review.state.json",
@@ -335,7 +365,7 @@ class TestHtmlReport(unittest.TestCase):
 
     def test_render_impact_preview_panel_from_report_without_raw_payload(self):
         html = render_group_diff_html(
-            make_doc(),
+            self.doc,
             group_selector="計算倍率変更",
             impact_preview_report={
                 "title": "Impact Preview: old.diffgr.json -> new.diffgr.json using review.state.json",
@@ -368,12 +398,12 @@ class TestHtmlReport(unittest.TestCase):
         self.assertIn(">groupBriefs:g-pr01<", html)
 
     def test_render_apply_selected_state_preview_uses_real_changed_section_count(self):
-        html = render_group_diff_html(make_doc(), group_selector="計算倍率変更")
+        html = self.group_html
         self.assertIn("function countChangedSections(diff)", html)
         self.assertIn("changedSectionCount: countChangedSections(resultDiff)", html)
 
     def test_render_diff_state_uses_modal_and_token_reuse_flow(self):
-        html = render_group_diff_html(make_doc(), group_selector="計算倍率変更")
+        html = self.group_html
         self.assertIn('id="state-diff-modal"', html)
         self.assertIn('id="state-diff-preview"', html)
         self.assertIn('id="state-diff-copy"', html)
@@ -384,7 +414,7 @@ class TestHtmlReport(unittest.TestCase):
         self.assertNotIn('window.alert("State Diff vs ', html)
 
     def test_render_apply_selected_state_uses_preview_modal_flow(self):
-        html = render_group_diff_html(make_doc(), group_selector="計算倍率変更")
+        html = self.group_html
         self.assertIn('id="state-selection-preview"', html)
         self.assertIn('id="state-selection-preview-btn"', html)
         self.assertIn("Run Preview first for the current tokens.", html)
@@ -394,7 +424,7 @@ class TestHtmlReport(unittest.TestCase):
 
     def test_render_impact_plan_apply_opens_preview_modal_directly(self):
         html = render_group_diff_html(
-            make_doc(),
+            self.doc,
             group_selector="計算倍率変更",
             impact_preview_payload={
                 "impactSummary": {"impactedGroupCount": 1, "unchangedGroupCount": 0, "impactedGroups": []},
@@ -415,7 +445,7 @@ class TestHtmlReport(unittest.TestCase):
 
     def test_render_impact_preview_state_diff_keeps_detail_rows_for_all_sections(self):
         html = render_group_diff_html(
-            make_doc(),
+            self.doc,
             group_selector="計算倍率変更",
             impact_preview_payload={
                 "impactSummary": {"impactedGroupCount": 1, "unchangedGroupCount": 0, "impactedGroups": []},
@@ -501,7 +531,7 @@ class TestHtmlReport(unittest.TestCase):
         self.assertEqual(embedded["threadState"]["c1"]["open"], True)
 
     def test_render_includes_state_restore_helpers(self):
-        html = render_group_diff_html(make_doc(), group_selector="計算倍率変更", save_state_url="/api/state")
+        html = render_group_diff_html(self.doc, group_selector="計算倍率変更", save_state_url="/api/state")
         self.assertIn("function persistAnalysisState()", html)
         self.assertIn("function restoreAnalysisState()", html)
         self.assertIn('analysisState.selectedChunkId', html)
@@ -523,155 +553,134 @@ class TestHtmlReport(unittest.TestCase):
         self.assertIn("g-pr02", html)
 
     def test_export_script_writes_html(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            repo = Path(tempdir)
-            input_path = repo / "doc.diffgr.json"
-            output_path = repo / "out" / "report.html"
-            input_path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            code = export_html_main(
-                [
-                    "--input",
-                    str(input_path),
-                    "--output",
-                    str(output_path),
-                    "--group",
-                    "計算倍率変更",
-                ]
-            )
-            self.assertEqual(code, 0)
-            self.assertTrue(output_path.exists())
-            html = output_path.read_text(encoding="utf-8")
-            self.assertIn("計算倍率変更", html)
-            self.assertIn("src/a.ts", html)
-
-    def test_export_script_embeds_save_state_url(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            repo = Path(tempdir)
-            input_path = repo / "doc.diffgr.json"
-            output_path = repo / "out" / "report.html"
-            input_path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            code = export_html_main(
-                [
-                    "--input",
-                    str(input_path),
-                    "--output",
-                    str(output_path),
-                    "--group",
-                    "計算倍率変更",
-                    "--save-state-url",
-                    "/api/state",
-                    "--save-state-label",
-                    "Save Live",
-                ]
-            )
-            self.assertEqual(code, 0)
-            html = output_path.read_text(encoding="utf-8")
-            config = extract_report_config_json(html)
-            self.assertEqual(config.get("saveStateUrl"), "/api/state")
-            self.assertEqual(config.get("saveStateLabel"), "Save Live")
+        # End-to-end smoke test of the CLI, including flag plumbing into the report config;
+        # rendering details are covered in memory by the render_* tests.
+        repo = self._make_test_dir()
+        input_path = repo / "doc.diffgr.json"
+        output_path = repo / "out" / "report.html"
+        input_path.write_bytes(self.doc_bytes)
+        code = export_html_main(
+            [
+                "--input",
+                str(input_path),
+                "--output",
+                str(output_path),
+                "--group",
+                "計算倍率変更",
+                "--save-state-url",
+                "/api/state",
+                "--save-state-label",
+                "Save Live",
+            ]
+        )
+        self.assertEqual(code, 0)
+        self.assertTrue(output_path.exists())
+        html = output_path.read_text(encoding="utf-8")
+        self.assertIn("計算倍率変更", html)
+        self.assertIn("src/a.ts", html)
+        config = extract_report_config_json(html)
+        self.assertEqual(config.get("saveStateUrl"), "/api/state")
+        self.assertEqual(config.get("saveStateLabel"), "Save Live")
 
     def test_export_script_overlays_external_state(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            repo = Path(tempdir)
-            input_path = repo / "doc.diffgr.json"
-            state_path = repo / "state.json"
-            output_path = repo / "out" / "report.html"
-            input_path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            state_path.write_text(
-                json.dumps(
-                    {
-                        "reviews": {"c1": {"status": "reviewed"}},
-                        "groupBriefs": {"g-pr01": {"summary": "handoff"}},
-                        "analysisState": {"selectedChunkId": "c1"},
-                        "threadState": {"c1": {"open": True}},
-                    },
-                    ensure_ascii=False,
-                    indent=2,
-                )
-                + "\n",
-                encoding="utf-8",
-            )
-            code = export_html_main(
-                [
-                    "--input",
-                    str(input_path),
-                    "--state",
-                    str(state_path),
-                    "--output",
-                    str(output_path),
-                    "--group",
-                    "計算倍率変更",
-                ]
+        repo = self._make_test_dir()
+        input_path = repo / "doc.diffgr.json"
+        state_path = repo / "state.json"
+        output_path = repo / "out" / "report.html"
+        input_path.write_bytes(self.doc_bytes)
+        state_path.write_text(
+            json.dumps(
+                {
+                    "reviews": {"c1": {"status": "reviewed"}},
+                    "groupBriefs": {"g-pr01": {"summary": "handoff"}},
+                    "analysisState": {"selectedChunkId": "c1"},
+                    "threadState": {"c1": {"open": True}},
+                },
+                ensure_ascii=False,
+                indent=2,
             )
-            self.assertEqual(code, 0)
-            html = output_path.read_text(encoding="utf-8")
-            embedded = extract_report_doc_json(html)
-            config = extract_report_config_json(html)
-            self.assertEqual(embedded["reviews"]["c1"]["status"], "reviewed")
-            self.assertEqual(embedded["groupBriefs"]["g-pr01"]["summary"], "handoff")
-            self.assertEqual(embedded["analysisState"]["selectedChunkId"], "c1")
-            self.assertEqual(config.get("stateSourceLabel"), "overlay:state.json")
+            + "\n",
+            encoding="utf-8",
+        )
+        code = export_html_main(
+            [
+                "--input",
+                str(input_path),
+                "--state",
+                str(state_path),
+                "--output",
+                str(output_path),
+                "--group",
+                "計算倍率変更",
+            ]
+        )
+        self.assertEqual(code, 0)
+        html = output_path.read_text(encoding="utf-8")
+        embedded = extract_report_doc_json(html)
+        config = extract_report_config_json(html)
+        self.assertEqual(embedded["reviews"]["c1"]["status"], "reviewed")
+        self.assertEqual(embedded["groupBriefs"]["g-pr01"]["summary"], "handoff")
+        self.assertEqual(embedded["analysisState"]["selectedChunkId"], "c1")
+        self.assertEqual(config.get("stateSourceLabel"), "overlay:state.json")
 
     def test_export_script_embeds_impact_preview_when_args_are_provided(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            repo = Path(tempdir)
-            old_path = repo / "old.diffgr.json"
-            input_path = repo / "new.diffgr.json"
-            state_path = repo / "review.state.json"
-            output_path = repo / "out" / "report.html"
-            old_doc = make_doc()
-            new_doc = make_doc()
-            new_doc["chunks"][0]["lines"][2]["text"] = "  return a * 3;"
-            old_path.write_text(json.dumps(old_doc, ensure_ascii=False), encoding="utf-8")
-            input_path.write_text(json.dumps(new_doc, ensure_ascii=False), encoding="utf-8")
-            state_path.write_text(
-                json.dumps({"groupBriefs": {"g-pr01": {"status": "ready", "summary": "handoff"}}}, ensure_ascii=False),
-                encoding="utf-8",
-            )
-            code = export_html_main(
-                [
-                    "--input",
-                    str(input_path),
-                    "--output",
-                    str(output_path),
-                    "--group",
-                    "計算倍率変更",
-                    "--impact-old",
-                    str(old_path),
-                    "--impact-state",
-                    str(state_path),
-                ]
-            )
-            self.assertEqual(code, 0)
-            html = output_path.read_text(encoding="utf-8")
-            self.assertIn('id="toggle-impact-preview"', html)
-            self.assertIn("Impact</h3>", html)
-            self.assertIn("Group Brief Changes", html)
-            config = extract_report_config_json(html)
-            self.assertEqual(
-                config["impactPreviewReport"]["sourceLabel"],
-                "old.diffgr.json -> new.diffgr.json using review.state.json",
-            )
+        repo = self._make_test_dir()
+        old_path = repo / "old.diffgr.json"
+        input_path = repo / "new.diffgr.json"
+        state_path = repo / "review.state.json"
+        output_path = repo / "out" / "report.html"
+        old_doc = make_doc()
+        new_doc = make_doc()
+        new_doc["chunks"][0]["lines"][2]["text"] = "  return a * 3;"
+        old_path.write_text(json.dumps(old_doc, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        input_path.write_text(json.dumps(new_doc, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        state_path.write_text(
+            json.dumps({"groupBriefs": {"g-pr01": {"status": "ready", "summary": "handoff"}}}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        code = export_html_main(
+            [
+                "--input",
+                str(input_path),
+                "--output",
+                str(output_path),
+                "--group",
+                "計算倍率変更",
+                "--impact-old",
+                str(old_path),
+                "--impact-state",
+                str(state_path),
+            ]
+        )
+        self.assertEqual(code, 0)
+        html = output_path.read_text(encoding="utf-8")
+        self.assertIn('id="toggle-impact-preview"', html)
+        self.assertIn("Impact</h3>", html)
+        self.assertIn("Group Brief Changes", html)
+        config = extract_report_config_json(html)
+        self.assertEqual(
+            config["impactPreviewReport"]["sourceLabel"],
+            "old.diffgr.json -> new.diffgr.json using review.state.json",
+        )
 
     def test_export_script_rejects_partial_impact_args(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            repo = Path(tempdir)
-            input_path = repo / "doc.diffgr.json"
-            output_path = repo / "out" / "report.html"
-            input_path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            code = export_html_main(
-                [
-                    "--input",
-                    str(input_path),
-                    "--output",
-                    str(output_path),
-                    "--group",
-                    "計算倍率変更",
-                    "--impact-old",
-                    str(input_path),
-                ]
-            )
-            self.assertEqual(code, 1)
+        repo = self._make_test_dir()
+        input_path = repo / "doc.diffgr.json"
+        output_path = repo / "out" / "report.html"
+        input_path.write_bytes(self.doc_bytes)
+        code = export_html_main(
+            [
+                "--input",
+                str(input_path),
+                "--output",
+                str(output_path),
+                "--group",
+                "計算倍率変更",
+                "--impact-old",
+                str(input_path),
+            ]
+        )
+        self.assertEqual(code, 1)
 
     def test_render_embeds_state_diff_report_in_config(self):
         state_diff_report = {
@@ -685,14 +694,14 @@ class TestHtmlReport(unittest.TestCase):
             "rows": [{"section": "reviews", "changeKind": "added", "key": "c1", "preview": "reviewed", "selectionToken": "reviews:c1"}],
             "selectionTokens": ["reviews:c1"],
         }
-        html = render_group_diff_html(make_doc(), group_selector="計算倍率変更", state_diff_report=state_diff_report)
+        html = render_group_diff_html(self.doc, group_selector="計算倍率変更", state_diff_report=state_diff_report)
         config = extract_report_config_json(html)
         self.assertIsNotNone(config.get("stateDiffReport"))
         self.assertEqual(config["stateDiffReport"]["sourceLabel"], "state.json")
         self.assertEqual(config["stateDiffReport"]["selectionTokens"], ["reviews:c1"])
 
     def test_render_includes_build_stat_diff_report_and_render_stat_diff_report_js(self):
-        html = render_group_diff_html(make_doc(), group_selector="計算倍率変更")
+        html = self.group_html
         self.assertIn("function buildStateDiffReport(baseState, otherState, sourceLabel)", html)
         self.assertIn("function renderStateDiffReport(report)", html)
         self.assertIn("function buildSelectionPreviewReport(rawTokens, sourceLabel, baseLabel)", html)
@@ -700,76 +709,74 @@ class TestHtmlReport(unittest.TestCase):
         self.assertIn("function buildDiffRows(diff)", html)
 
     def test_render_diff_state_uses_build_stat_diff_report(self):
-        html = render_group_diff_html(make_doc(), group_selector="計算倍率変更")
+        html = self.group_html
         self.assertIn("buildStateDiffReport(currentStatePayload(), state.importedStatePayload, label)", html)
         self.assertIn("renderStateDiffReport(report)", html)
         self.assertNotIn("renderStateDiffSummary(diff)", html)
 
     def test_render_apply_selected_state_uses_build_selection_preview_report(self):
-        html = render_group_diff_html(make_doc(), group_selector="計算倍率変更")
+        html = self.group_html
         self.assertIn("buildSelectionPreviewReport(rawTokens", html)
         self.assertIn("renderSelectionPreviewReport(report)", html)
 
     def test_export_script_embeds_state_diff_report_when_state_is_provided(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            repo = Path(tempdir)
-            input_path = repo / "doc.diffgr.json"
-            state_path = repo / "state.json"
-            output_path = repo / "out" / "report.html"
-            doc = make_doc()
-            input_path.write_text(json.dumps(doc, ensure_ascii=False), encoding="utf-8")
-            state_path.write_text(
-                json.dumps(
-                    {"reviews": {"c1": {"status": "reviewed"}}, "groupBriefs": {}},
-                    ensure_ascii=False,
-                )
-                + "\n",
-                encoding="utf-8",
-            )
-            code = export_html_main(
-                [
-                    "--input", str(input_path),
-                    "--state", str(state_path),
-                    "--output", str(output_path),
-                    "--group", "計算倍率変更",
-                ]
+        repo = self._make_test_dir()
+        input_path = repo / "doc.diffgr.json"
+        state_path = repo / "state.json"
+        output_path = repo / "out" / "report.html"
+        doc = make_doc()
+        input_path.write_text(json.dumps(doc, ensure_ascii=False), encoding="utf-8")
+        state_path.write_text(
+            json.dumps(
+                {"reviews": {"c1": {"status": "reviewed"}}, "groupBriefs": {}},
+                ensure_ascii=False,
             )
-            self.assertEqual(code, 0)
-            html = output_path.read_text(encoding="utf-8")
-            config = extract_report_config_json(html)
-            self.assertIsNotNone(config.get("stateDiffReport"))
-            self.assertEqual(config["stateDiffReport"]["sourceLabel"], "state.json")
-            self.assertIn("reviews:c1", config["stateDiffReport"]["selectionTokens"])
+            + "\n",
+            encoding="utf-8",
+        )
+        code = export_html_main(
+            [
+                "--input", str(input_path),
+                "--state", str(state_path),
+                "--output", str(output_path),
+                "--group", "計算倍率変更",
+            ]
+        )
+        self.assertEqual(code, 0)
+        html = output_path.read_text(encoding="utf-8")
+        config = extract_report_config_json(html)
+        self.assertIsNotNone(config.get("stateDiffReport"))
+        self.assertEqual(config["stateDiffReport"]["sourceLabel"], "state.json")
+        self.assertIn("reviews:c1", config["stateDiffReport"]["selectionTokens"])
 
     def test_export_script_rejects_mismatched_state_and_impact_state(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            repo = Path(tempdir)
-            old_path = repo / "old.diffgr.json"
-            input_path = repo / "new.diffgr.json"
-            state_path = repo / "view.state.json"
-            impact_state_path = repo / "impact.state.json"
-            output_path = repo / "out" / "report.html"
-            old_path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            input_path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            state_path.write_text(json.dumps({"reviews": {}}, ensure_ascii=False), encoding="utf-8")
-            impact_state_path.write_text(json.dumps({"reviews": {}}, ensure_ascii=False), encoding="utf-8")
-            code = export_html_main(
-                [
-                    "--input",
-                    str(input_path),
-                    "--state",
-                    str(state_path),
-                    "--output",
-                    str(output_path),
-                    "--group",
-                    "計算倍率変更",
-                    "--impact-old",
-                    str(old_path),
-                    "--impact-state",
-                    str(impact_state_path),
-                ]
-            )
-            self.assertEqual(code, 1)
+        repo = self._make_test_dir()
+        old_path = repo / "old.diffgr.json"
+        input_path = repo / "new.diffgr.json"
+        state_path = repo / "view.state.json"
+        impact_state_path = repo / "impact.state.json"
+        output_path = repo / "out" / "report.html"
+        old_path.write_bytes(self.doc_bytes)
+        input_path.write_bytes(self.doc_bytes)
+        state_path.write_text(json.dumps({"reviews": {}}, ensure_ascii=False), encoding="utf-8")
+        impact_state_path.write_text(json.dumps({"reviews": {}}, ensure_ascii=False), encoding="utf-8")
+        code = export_html_main(
+            [
+                "--input",
+                str(input_path),
+                "--state",
+                str(state_path),
+                "--output",
+                str(output_path),
+                "--group",
+                "計算倍率変更",
+                "--impact-old",
+                str(old_path),
+                "--impact-state",
+                str(impact_state_path),
+            ]
+        )
+        self.assertEqual(code, 1)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from tests._docs import dump_doc
+
 from scripts.rebase_reviews import main
 
 
@@ -66,8 +68,8 @@ class TestRebaseReviewsScript(unittest.TestCase):
                 assignments={"g-all": ["new1", "new2"]},
                 reviews={},
             )
-            old_path.write_text(json.dumps(old_doc, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-            new_path.write_text(json.dumps(new_doc, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            old_path.write_text(dump_doc(old_doc), encoding="utf-8")
+            new_path.write_text(dump_doc(new_doc), encoding="utf-8")
 
             code = main(
                 [
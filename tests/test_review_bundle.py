@@ -2,25 +2,22 @@ from __future__ import annotations
 
 import io
 import json
-import sys
 import tempfile
 import unittest
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from tests import _testpath  # noqa: F401
 
-from diffgr.approval import approve_group  # noqa: E402
-from diffgr.review_bundle import (  # noqa: E402
+from diffgr.approval import approve_group
+from diffgr.review_bundle import (
     build_review_bundle_manifest,
     compose_document_from_bundle,
     split_document_into_bundle,
     verify_review_bundle_artifacts,
 )
-from scripts.export_review_bundle import main as export_bundle_main  # noqa: E402
-from scripts.verify_review_bundle import main as verify_bundle_main  # noqa: E402
+from scripts.export_review_bundle import main as export_bundle_main
+from scripts.verify_review_bundle import main as verify_bundle_main
 
 
 class TestReviewBundle(unittest.TestCase):
@@ -1,14 +1,10 @@
 import json
-import sys
 import unittest
-from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from tests import _testpath  # noqa: F401
 
-from diffgr.review_rebase import rebase_review_state, stable_fingerprint_for_chunk  # noqa: E402
-from diffgr.viewer_core import validate_document  # noqa: E402
+from diffgr.review_rebase import rebase_review_state, stable_fingerprint_for_chunk
+from diffgr.viewer_core import validate_document
 
 
 def make_chunk(
@@ -50,6 +46,14 @@ def make_doc(*, chunks: list[dict], groups: list[dict], assignments: dict, revie
     }
 
 
+_SINGLE_LINE_MATCH_CASES = (
+    # (name, old filePath, new filePath, new line text, similarity_threshold, summary counter, expected status)
+    ("similar edit", "src/a.ts", "src/a.ts", "return base * 3;", 0.70, "matched_similar", "needsReReview"),
+    ("rename only", "src/legacy/a.ts", "src/new/a.ts", "return base * 2;", 0.86, "matched_stable", "reviewed"),
+    ("rename with edit", "src/legacy/a.ts", "src/new/a.ts", "return base * 3;", 0.70, "matched_similar", "needsReReview"),
+)
+
+
 class TestReviewRebase(unittest.TestCase):
     def test_stable_match_carries_review_and_remaps_line_comments(self):
         old_lines = [
@@ -107,59 +111,72 @@ class TestReviewRebase(unittest.TestCase):
         )
 
         out_doc, summary, warnings = rebase_review_state(old_doc=old_doc, new_doc=new_doc, preserve_groups=True)
-        self.assertEqual(warnings, [])
         validate_document(out_doc)
-        self.assertEqual(out_doc["groups"][0]["id"], "g1")
-        self.assertEqual(out_doc["assignments"]["g1"], ["new1"])
-        self.assertEqual(out_doc["reviews"]["new1"]["status"], "reviewed")
-        self.assertEqual(out_doc["reviews"]["new1"]["comment"], "ok")
-        line_comments = out_doc["reviews"]["new1"].get("lineComments") or []
-        self.assertEqual(len(line_comments), 1)
-        self.assertEqual(line_comments[0]["newLine"], 11)
-
-        self.assertEqual(summary.matched_stable, 1)
-        self.assertEqual(summary.carried_reviews, 1)
-
-    def test_similar_match_marks_reviewed_as_needs_rereview(self):
-        old_chunk = make_chunk(
-            chunk_id="old1",
-            file_path="src/a.ts",
-            old_start=1,
-            new_start=1,
-            header="h1",
-            lines=[{"kind": "add", "text": "return base * 2;", "oldLine": None, "newLine": 1}],
-        )
-        new_chunk = make_chunk(
-            chunk_id="new1",
-            file_path="src/a.ts",
-            old_start=1,
-            new_start=1,
-            header="h1",
-            lines=[{"kind": "add", "text": "return base * 3;", "oldLine": None, "newLine": 1}],
+        self.assertEqual(
+            {
+                "warnings": warnings,
+                "matchedStable": summary.matched_stable,
+                "carriedReviews": summary.carried_reviews,
+                "groupId": out_doc["groups"][0]["id"],
+                "assigned": out_doc["assignments"]["g1"],
+                "status": out_doc["reviews"]["new1"]["status"],
+                "comment": out_doc["reviews"]["new1"]["comment"],
+                "lineCommentNewLines": [item["newLine"] for item in out_doc["reviews"]["new1"].get("lineComments") or []],
+            },
+            {
+                "warnings": [],
+                "matchedStable": 1,
+                "carriedReviews": 1,
+                "groupId": "g1",
+                "assigned": ["new1"],
+                "status": "reviewed",
+                "comment": "ok",
+                "lineCommentNewLines": [11],
+            },
         )
 
-        old_doc = make_doc(
-            chunks=[old_chunk],
-            groups=[{"id": "g1", "name": "A", "order": 1}],
-            assignments={"g1": ["old1"]},
-            reviews={"old1": {"status": "reviewed", "comment": "ok"}},
-        )
-        new_doc = make_doc(
-            chunks=[new_chunk],
-            groups=[{"id": "g-all", "name": "All", "order": 1}],
-            assignments={"g-all": ["new1"]},
-            reviews={},
-        )
+    def test_single_line_matches(self):
+        for name, old_file_path, new_file_path, new_text, threshold, counter, expected_status in _SINGLE_LINE_MATCH_CASES:
+            with self.subTest(name):
+                old_chunk = make_chunk(
+                    chunk_id="old1",
+                    file_path=old_file_path,
+                    old_start=1,
+                    new_start=1,
+                    header="h1",
+                    lines=[{"kind": "add", "text": "return base * 2;", "oldLine": None, "newLine": 1}],
+                )
+                new_chunk = make_chunk(
+                    chunk_id="new1",
+                    file_path=new_file_path,
+                    old_start=1,
+                    new_start=1,
+                    header="h1",
+                    lines=[{"kind": "add", "text": new_text, "oldLine": None, "newLine": 1}],
+                )
+                old_doc = make_doc(
+                    chunks=[old_chunk],
+                    groups=[{"id": "g1", "name": "A", "order": 1}],
+                    assignments={"g1": ["old1"]},
+                    reviews={"old1": {"status": "reviewed", "comment": "ok"}},
+                )
+                new_doc = make_doc(
+                    chunks=[new_chunk],
+                    groups=[{"id": "g-all", "name": "All", "order": 1}],
+                    assignments={"g-all": ["new1"]},
+                    reviews={},
+                )
 
-        out_doc, summary, warnings = rebase_review_state(
-            old_doc=old_doc,
-            new_doc=new_doc,
-            preserve_groups=True,
-            similarity_threshold=0.70,
-        )
-        self.assertEqual(warnings, [])
-        self.assertEqual(summary.matched_similar, 1)
-        self.assertEqual(out_doc["reviews"]["new1"]["status"], "needsReReview")
+                out_doc, summary, warnings = rebase_review_state(
+                    old_doc=old_doc,
+                    new_doc=new_doc,
+                    preserve_groups=True,
+                    similarity_threshold=threshold,
+                )
+                self.assertEqual(
+                    (warnings, getattr(summary, counter), out_doc["reviews"]["new1"]["status"]),
+                    ([], 1, expected_status),
+                )
 
     def test_preserve_groups_keeps_empty_assignment_keys(self):
         old_chunk = make_chunk(
@@ -235,88 +252,11 @@ class TestReviewRebase(unittest.TestCase):
             preserve_groups=True,
             similarity_threshold=0.70,
         )
-        self.assertEqual(warnings, [])
-        self.assertEqual(summary.matched_delta, 1)
-        self.assertEqual(out_doc["reviews"]["new1"]["status"], "reviewed")
         # We intentionally do not carry lineComments for delta match (context changed).
-        self.assertIsNone(out_doc["reviews"]["new1"].get("lineComments"))
-
-    def test_rename_only_match_carries_reviewed_across_file_path_change(self):
-        old_chunk = make_chunk(
-            chunk_id="old1",
-            file_path="src/legacy/a.ts",
-            old_start=1,
-            new_start=1,
-            header="h1",
-            lines=[{"kind": "add", "text": "return base * 2;", "oldLine": None, "newLine": 1}],
+        self.assertEqual(
+            (warnings, summary.matched_delta, out_doc["reviews"]["new1"]["status"], out_doc["reviews"]["new1"].get("lineComments")),
+            ([], 1, "reviewed", None),
         )
-        new_chunk = make_chunk(
-            chunk_id="new1",
-            file_path="src/new/a.ts",
-            old_start=1,
-            new_start=1,
-            header="h1",
-            lines=[{"kind": "add", "text": "return base * 2;", "oldLine": None, "newLine": 1}],
-        )
-
-        old_doc = make_doc(
-            chunks=[old_chunk],
-            groups=[{"id": "g1", "name": "A", "order": 1}],
-            assignments={"g1": ["old1"]},
-            reviews={"old1": {"status": "reviewed", "comment": "ok"}},
-        )
-        new_doc = make_doc(
-            chunks=[new_chunk],
-            groups=[{"id": "g-all", "name": "All", "order": 1}],
-            assignments={"g-all": ["new1"]},
-            reviews={},
-        )
-
-        out_doc, summary, warnings = rebase_review_state(old_doc=old_doc, new_doc=new_doc, preserve_groups=True)
-        self.assertEqual(warnings, [])
-        self.assertEqual(summary.matched_stable, 1)
-        self.assertEqual(out_doc["reviews"]["new1"]["status"], "reviewed")
-
-    def test_rename_with_edit_uses_similarity_and_marks_needs_rereview(self):
-        old_chunk = make_chunk(
-            chunk_id="old1",
-            file_path="src/legacy/a.ts",
-            old_start=1,
-            new_start=1,
-            header="h1",
-            lines=[{"kind": "add", "text": "return base * 2;", "oldLine": None, "newLine": 1}],
-        )
-        new_chunk = make_chunk(
-            chunk_id="new1",
-            file_path="src/new/a.ts",
-            old_start=1,
-            new_start=1,
-            header="h1",
-            lines=[{"kind": "add", "text": "return base * 3;", "oldLine": None, "newLine": 1}],
-        )
-
-        old_doc = make_doc(
-            chunks=[old_chunk],
-            groups=[{"id": "g1", "name": "A", "order": 1}],
-            assignments={"g1": ["old1"]},
-            reviews={"old1": {"status": "reviewed", "comment": "ok"}},
-        )
-        new_doc = make_doc(
-            chunks=[new_chunk],
-            groups=[{"id": "g-all", "name": "All", "order": 1}],
-            assignments={"g-all": ["new1"]},
-            reviews={},
-        )
-
-        out_doc, summary, warnings = rebase_review_state(
-            old_doc=old_doc,
-            new_doc=new_doc,
-            preserve_groups=True,
-            similarity_threshold=0.70,
-        )
-        self.assertEqual(warnings, [])
-        self.assertEqual(summary.matched_similar, 1)
-        self.assertEqual(out_doc["reviews"]["new1"]["status"], "needsReReview")
 
     def test_preserve_groups_carries_group_briefs_and_marks_stale_when_head_changes(self):
         old_chunk = make_chunk(
@@ -1,21 +1,21 @@
 import json
-import sys
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from tests import _testpath  # noqa: F401
+from tests._docs import dump_doc
 
-from diffgr.review_split import (  # noqa: E402
+from diffgr.review_split import (
     build_group_output_filename,
     build_group_review_document,
     merge_reviews_into_base,
     split_document_by_group,
 )
-from scripts.merge_group_reviews import main as merge_group_reviews_main  # noqa: E402
-from scripts.split_group_reviews import main as split_group_reviews_main  # noqa: E402
+from scripts.merge_group_reviews import main as merge_group_reviews_main
+from scripts.split_group_reviews import main as split_group_reviews_main
 
 
 def make_doc() -> dict:
@@ -216,10 +216,10 @@ class TestReviewSplit(unittest.TestCase):
         self.assertEqual(merged["threadState"]["selectedLineAnchor"]["anchorKey"], "add::3")
 
     def test_split_group_reviews_script_and_merge_group_reviews_script(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with tempfile.TemporaryDirectory() as tmpdir, patch.dict(os.environ, {"DIFFGR_CACHE_DIR": str(Path(tmpdir) / "cache")}):
             root = Path(tmpdir)
             base_path = root / "base.diffgr.json"
-            base_path.write_text(json.dumps(make_doc(), ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            base_path.write_text(dump_doc(make_doc()), encoding="utf-8")
             split_dir = root / "split"
 
             code = split_group_reviews_main(
@@ -232,7 +232,7 @@ class TestReviewSplit(unittest.TestCase):
             )
             self.assertEqual(code, 0)
 
-            split_files = sorted(path for path in split_dir.glob("*.diffgr.json"))
+            split_files = sorted(Path(entry.path) for entry in os.scandir(split_dir) if entry.name.endswith(".diffgr.json"))
             self.assertEqual(len(split_files), 2)
 
             # Simulate two reviewers by editing each split file.
@@ -240,8 +240,8 @@ class TestReviewSplit(unittest.TestCase):
             reviewer_b = json.loads(split_files[1].read_text(encoding="utf-8"))
             reviewer_a.setdefault("reviews", {})["c1"] = {"status": "reviewed", "comment": "A done"}
             reviewer_b.setdefault("reviews", {})["c3"] = {"status": "ignored", "comment": "B ignored"}
-            split_files[0].write_text(json.dumps(reviewer_a, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-            split_files[1].write_text(json.dumps(reviewer_b, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            split_files[0].write_text(dump_doc(reviewer_a), encoding="utf-8")
+            split_files[1].write_text(dump_doc(reviewer_b), encoding="utf-8")
 
             merged_path = root / "merged.diffgr.json"
             code = merge_group_reviews_main(
@@ -2,18 +2,15 @@ from __future__ import annotations
 
 import io
 import json
-import sys
 import tempfile
 import unittest
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from tests import _testpath  # noqa: F401
 
-from diffgr.reviewability import compute_all_group_reviewability, compute_group_reviewability  # noqa: E402
-from scripts.summarize_reviewability import main as summarize_reviewability_main  # noqa: E402
+from diffgr.reviewability import compute_all_group_reviewability, compute_group_reviewability
+from scripts.summarize_reviewability import main as summarize_reviewability_main
 
 
 class TestReviewability(unittest.TestCase):
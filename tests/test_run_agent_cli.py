@@ -1,12 +1,15 @@
+import ctypes
+import sys
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from scripts.run_agent_cli import (
     _as_fenced_markdown_block,
     _build_finalize_prompt,
     _build_interactive_initial_prompt,
+    _copy_to_clipboard_windows,
     _extract_split_conflicts,
     _find_split_name_conflicts,
     main,
@@ -26,6 +29,25 @@ class TestRunAgentCliScript(unittest.TestCase):
         self.assertIn("```json", block)
         self.assertTrue(block.rstrip().endswith(fence))
 
+    @unittest.skipIf(sys.platform.startswith("win"), "Win32 clipboard is available on Windows")
+    def test_copy_to_clipboard_windows_reports_unavailable_off_windows(self):
+        self.assertFalse(_copy_to_clipboard_windows("prompt"))
+
+    def test_copy_to_clipboard_windows_frees_handle_when_empty_clipboard_fails(self):
+        buffer = ctypes.create_string_buffer(64)
+        kernel32 = Mock()
+        kernel32.GlobalAlloc.return_value = 1
+        kernel32.GlobalLock.return_value = ctypes.addressof(buffer)
+        user32 = Mock()
+        user32.OpenClipboard.return_value = 1
+        user32.EmptyClipboard.return_value = 0
+        dlls = {"user32": user32, "kernel32": kernel32}
+        with patch("ctypes.WinDLL", side_effect=lambda name, **_kwargs: dlls[name], create=True):
+            self.assertFalse(_copy_to_clipboard_windows("prompt"))
+        user32.SetClipboardData.assert_not_called()
+        kernel32.GlobalFree.assert_called_once_with(1)
+        user32.CloseClipboard.assert_called_once_with()
+
     def test_write_interactive_session_note_keeps_prompt_verbatim(self):
         markdown = "# prompt\n\n```json\n{\"rename\": {}, \"move\": []}\n```\n"
         with tempfile.TemporaryDirectory() as tempdir:
@@ -120,9 +142,13 @@ class TestRunAgentCliScript(unittest.TestCase):
                 "move": [],
             }
 
-            with patch("scripts.run_agent_cli.ROOT", repo), patch(
-                "scripts.run_agent_cli.shutil.which", return_value=r"C:\tools\codex.cmd"
-            ), patch("scripts.run_agent_cli.run_agent_cli", side_effect=[bad_patch, good_patch]) as run_once:
+            run_once = Mock(side_effect=[bad_patch, good_patch])
+            with patch.multiple(
+                "scripts.run_agent_cli",
+                ROOT=repo,
+                which_command=Mock(return_value=r"C:\tools\codex.cmd"),
+                run_agent_cli=run_once,
+            ):
                 code = main(
                     [
                         "--config",
@@ -1,20 +1,22 @@
+import io
 import json
-import sys
-import tempfile
 import threading
 import unittest
-from pathlib import Path
+from unittest.mock import Mock, patch
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from tests import _testpath  # noqa: F401
+from tests._tempdir import ClassTempDirMixin
 
-from scripts.serve_diffgr_report import (  # noqa: E402
+from scripts.serve_diffgr_report import (
     ServerState,
+    _etag_matches,
+    _handler_factory,
     _normalize_state_payload,
+    _read_request_body,
     save_review_state_to_file,
     save_review_state_to_document,
 )
+from diffgr.viewer_core import load_json
 
 
 def extract_report_config_json(html: str) -> dict:
@@ -55,7 +57,7 @@ def make_doc() -> dict:
     }
 
 
-class TestServeDiffgrReport(unittest.TestCase):
+class TestServeDiffgrReport(ClassTempDirMixin, unittest.TestCase):
     def test_normalize_state_payload_accepts_state_wrapper_and_partial_keys(self):
         wrapped = _normalize_state_payload(
             {
@@ -78,210 +80,328 @@ class TestServeDiffgrReport(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             _normalize_state_payload({"c1": {"comment": "ok"}})
 
+    def test_read_request_body_fills_buffer_and_truncates_on_eof(self):
+        body = json.dumps({"reviews": {"c1": {"comment": "ok"}}}).encode("utf-8")
+        raw = _read_request_body(io.BufferedReader(io.BytesIO(body), buffer_size=4), len(body))
+        self.assertEqual(bytes(raw), body)
+        self.assertEqual(json.loads(raw)["reviews"]["c1"]["comment"], "ok")
+        short = _read_request_body(io.BytesIO(b"{}"), 10)
+        self.assertEqual(bytes(short), b"{}")
+
+    def test_handler_dispatch_routes_on_path_without_query(self):
+        handler_cls = _handler_factory(ServerState(source_path=self._tmp_root / "unused.diffgr.json"))
+        for target in ("/api/health?ts=1", "http://127.0.0.1:8765/api/health?ts=1"):
+            with self.subTest(target):
+                handler = handler_cls.__new__(handler_cls)
+                handler.path = target
+                handler._write_json = Mock()
+                route = Mock()
+                handler._dispatch({"/api/health": route})
+                route.assert_called_once_with(handler)
+                handler._write_json.assert_not_called()
+
     def test_save_review_state_to_document_persists_full_state(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            path = Path(tempdir) / "doc.diffgr.json"
-            path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            result = save_review_state_to_document(
-                path,
-                {
-                    "reviews": {"c1": {"comment": "line by line"}},
-                    "groupBriefs": {"g-pr01": {"summary": "handoff"}},
-                    "analysisState": {"selectedGroupId": "g-pr01"},
-                    "threadState": {"c1": {"open": True}},
-                },
-            )
-            self.assertEqual(result["reviewChunkCount"], 1)
-            updated = json.loads(path.read_text(encoding="utf-8"))
-            self.assertEqual(updated["reviews"]["c1"]["comment"], "line by line")
-            self.assertEqual(updated["groupBriefs"]["g-pr01"]["summary"], "handoff")
-            self.assertEqual(updated["analysisState"]["selectedGroupId"], "g-pr01")
-            self.assertEqual(updated["threadState"]["c1"]["open"], True)
+        root = self._make_test_dir()
+        path = root / "doc.diffgr.json"
+        path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
+        result = save_review_state_to_document(
+            path,
+            {
+                "reviews": {"c1": {"comment": "line by line"}},
+                "groupBriefs": {"g-pr01": {"summary": "handoff"}},
+                "analysisState": {"selectedGroupId": "g-pr01"},
+                "threadState": {"c1": {"open": True}},
+            },
+            saved_at="2026-02-22T00:00:00Z",
+        )
+        self.assertEqual(result["reviewChunkCount"], 1)
+        self.assertEqual(result["savedAt"], "2026-02-22T00:00:00Z")
+        updated = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual(updated["reviews"]["c1"]["comment"], "line by line")
+        self.assertEqual(updated["groupBriefs"]["g-pr01"]["summary"], "handoff")
+        self.assertEqual(updated["analysisState"]["selectedGroupId"], "g-pr01")
+        self.assertEqual(updated["threadState"]["c1"]["open"], True)
 
     def test_server_state_render_html_embeds_save_endpoint(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            path = Path(tempdir) / "doc.diffgr.json"
-            path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            state = ServerState(
-                source_path=path,
-                state_path=None,
-                group_selector="g-pr01",
-                report_title=None,
-                lock=threading.Lock(),
-            )
-            html = state.render_html()
-            self.assertIn('"saveStateUrl": "/api/state"', html)
-            self.assertIn('id="save-state"', html)
+        root = self._make_test_dir()
+        path = root / "doc.diffgr.json"
+        path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
+        state = ServerState(
+            source_path=path,
+            state_path=None,
+            group_selector="g-pr01",
+            report_title=None,
+        )
+        html = state.render_html()
+        self.assertIn('"saveStateUrl": "/api/state"', html)
+        self.assertIn('id="save-state"', html)
+
+    def test_server_state_render_html_bytes_reuses_render_until_save(self):
+        root = self._make_test_dir()
+        path = root / "doc.diffgr.json"
+        path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
+        state = ServerState(source_path=path, group_selector="g-pr01")
+        first = state.render_html_bytes()
+        self.assertIs(state.render_html_bytes(), first)
+        self.assertEqual(first, state.render_html().encode("utf-8"))
+        state.save_state({"reviews": {"c1": {"status": "reviewed"}}})
+        updated = state.render_html_bytes()
+        self.assertIsNot(updated, first)
+        self.assertIn(b"data-status='reviewed'", updated)
+
+    def test_server_state_concurrent_cache_misses_render_once(self):
+        root = self._make_test_dir()
+        path = root / "doc.diffgr.json"
+        path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
+        state = ServerState(source_path=path, group_selector="g-pr01")
+        barrier = threading.Barrier(4)
+        calls: list[int] = []
+
+        def slow_render() -> str:
+            calls.append(1)
+            threading.Event().wait(0.05)
+            return "<html></html>"
+
+        def worker() -> None:
+            barrier.wait()
+            state.render_html_bytes()
+
+        with patch.object(state, "render_html", side_effect=slow_render):
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(state.render_html_bytes(), b"<html></html>")
+
+    def test_server_state_skips_revalidating_unchanged_source(self):
+        root = self._make_test_dir()
+        path = root / "doc.diffgr.json"
+        state_path = root / "state.json"
+        path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
+        state = ServerState(source_path=path, state_path=state_path, group_selector="g-pr01")
+        with patch("scripts.serve_diffgr_report.validate_document") as validate:
+            state.render_html_bytes()
+            state.save_state({"reviews": {"c1": {"status": "reviewed"}}})
+            html = state.render_html_bytes()
+        self.assertEqual(validate.call_count, 1)
+        self.assertIn(b"data-status='reviewed'", html)
+
+    def test_server_state_document_saves_drop_parsed_copy_and_keep_one_signature(self):
+        root = self._make_test_dir()
+        path = root / "doc.diffgr.json"
+        path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
+        state = ServerState(source_path=path, group_selector="g-pr01")
+        with patch("scripts.serve_diffgr_report.validate_document") as validate:
+            state.render_html_bytes()
+            for status in ("reviewed", "ignored", "reviewed"):
+                state.save_state({"reviews": {"c1": {"status": status}}})
+                self.assertNotIn(path, state._parsed)
+                html = state.render_html_bytes()
+                self.assertIn(f"data-status='{status}'".encode("utf-8"), html)
+        self.assertEqual(validate.call_count, 1)
+        self.assertEqual(list(state._validated), [path])
+
+    def test_server_state_reuses_parsed_source_until_it_changes(self):
+        root = self._make_test_dir()
+        path = root / "doc.diffgr.json"
+        state_path = root / "state.json"
+        path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
+        state = ServerState(source_path=path, state_path=state_path, group_selector="g-pr01")
+        with patch("scripts.serve_diffgr_report.load_json", wraps=load_json) as load:
+            first = state.render_html_bytes()
+            state.save_state({"reviews": {"c1": {"status": "reviewed"}}})
+            second = state.render_html_bytes()
+            self.assertEqual(load.call_count, 1)
+            doc = make_doc()
+            doc["meta"]["title"] = "Changed Source Title"
+            path.write_text(json.dumps(doc, ensure_ascii=False), encoding="utf-8")
+            third = state.render_html_bytes()
+        self.assertEqual(load.call_count, 2)
+        self.assertNotIn(b"data-status='reviewed'", first)
+        self.assertIn(b"data-status='reviewed'", second)
+        self.assertIn(b"Changed Source Title", third)
+
+    def test_server_state_etag_tracks_rendered_report(self):
+        root = self._make_test_dir()
+        path = root / "doc.diffgr.json"
+        path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
+        state = ServerState(source_path=path, group_selector="g-pr01")
+        _raw, etag = state.render_html_with_etag()
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'))
+        self.assertTrue(_etag_matches(etag, etag))
+        self.assertTrue(_etag_matches(f'"other", W/{etag}', etag))
+        self.assertFalse(_etag_matches(None, etag))
+        state.save_state({"reviews": {"c1": {"status": "reviewed"}}})
+        _raw, updated_etag = state.render_html_with_etag()
+        self.assertNotEqual(updated_etag, etag)
+        self.assertFalse(_etag_matches(etag, updated_etag))
 
     def test_server_state_save_state_persists_full_state(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            path = Path(tempdir) / "doc.diffgr.json"
-            path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            state = ServerState(
-                source_path=path,
-                state_path=None,
-                group_selector="g-pr01",
-                report_title=None,
-                lock=threading.Lock(),
-            )
-            result = state.save_state(
-                {
-                    "reviews": {"c1": {"comment": "ok"}},
-                    "groupBriefs": {"g-pr01": {"status": "ready", "summary": "handoff"}},
-                    "analysisState": {"selectedChunkId": "c1"},
-                    "threadState": {"c1": {"resolved": False}},
-                }
-            )
-            self.assertEqual(result["reviewChunkCount"], 1)
-            updated = json.loads(path.read_text(encoding="utf-8"))
-            self.assertEqual(updated["groupBriefs"]["g-pr01"]["summary"], "handoff")
-            self.assertEqual(updated["analysisState"]["selectedChunkId"], "c1")
-            self.assertEqual(updated["threadState"]["c1"]["resolved"], False)
+        root = self._make_test_dir()
+        path = root / "doc.diffgr.json"
+        path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
+        state = ServerState(
+            source_path=path,
+            state_path=None,
+            group_selector="g-pr01",
+            report_title=None,
+        )
+        result = state.save_state(
+            {
+                "reviews": {"c1": {"comment": "ok"}},
+                "groupBriefs": {"g-pr01": {"status": "ready", "summary": "handoff"}},
+                "analysisState": {"selectedChunkId": "c1"},
+                "threadState": {"c1": {"resolved": False}},
+            }
+        )
+        self.assertEqual(result["reviewChunkCount"], 1)
+        updated = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual(updated["groupBriefs"]["g-pr01"]["summary"], "handoff")
+        self.assertEqual(updated["analysisState"]["selectedChunkId"], "c1")
+        self.assertEqual(updated["threadState"]["c1"]["resolved"], False)
 
     def test_save_review_state_to_file_writes_state_json(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            path = Path(tempdir) / "state.json"
-            result = save_review_state_to_file(
-                path,
+        root = self._make_test_dir()
+        path = root / "state.json"
+        result = save_review_state_to_file(
+            path,
+            {
+                "reviews": {"c1": {"comment": "ok"}},
+                "groupBriefs": {"g-pr01": {"summary": "handoff"}},
+                "analysisState": {"selectedChunkId": "c1"},
+                "threadState": {"c1": {"open": True}},
+            },
+        )
+        self.assertEqual(result["reviewChunkCount"], 1)
+        updated = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual(updated["reviews"]["c1"]["comment"], "ok")
+        self.assertEqual(updated["groupBriefs"]["g-pr01"]["summary"], "handoff")
+        self.assertEqual(updated["analysisState"]["selectedChunkId"], "c1")
+        self.assertTrue(updated["threadState"]["c1"]["open"])
+
+    def test_server_state_render_html_overlays_external_state(self):
+        root = self._make_test_dir()
+        path = root / "doc.diffgr.json"
+        state_path = root / "state.json"
+        path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
+        state_path.write_text(
+            json.dumps(
                 {
-                    "reviews": {"c1": {"comment": "ok"}},
+                    "reviews": {"c1": {"status": "reviewed"}},
                     "groupBriefs": {"g-pr01": {"summary": "handoff"}},
-                    "analysisState": {"selectedChunkId": "c1"},
-                    "threadState": {"c1": {"open": True}},
                 },
+                ensure_ascii=False,
+                indent=2,
             )
-            self.assertEqual(result["reviewChunkCount"], 1)
-            updated = json.loads(path.read_text(encoding="utf-8"))
-            self.assertEqual(updated["reviews"]["c1"]["comment"], "ok")
-            self.assertEqual(updated["groupBriefs"]["g-pr01"]["summary"], "handoff")
-            self.assertEqual(updated["analysisState"]["selectedChunkId"], "c1")
-            self.assertTrue(updated["threadState"]["c1"]["open"])
-
-    def test_server_state_render_html_overlays_external_state(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            path = Path(tempdir) / "doc.diffgr.json"
-            state_path = Path(tempdir) / "state.json"
-            path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            state_path.write_text(
-                json.dumps(
-                    {
-                        "reviews": {"c1": {"status": "reviewed"}},
-                        "groupBriefs": {"g-pr01": {"summary": "handoff"}},
-                    },
-                    ensure_ascii=False,
-                    indent=2,
-                )
-                + "\n",
-                encoding="utf-8",
-            )
-            state = ServerState(
-                source_path=path,
-                state_path=state_path,
-                group_selector="g-pr01",
-                report_title=None,
-                lock=threading.Lock(),
-            )
-            html = state.render_html()
-            self.assertIn("data-status='reviewed'", html)
-            self.assertIn("handoff", html)
+            + "\n",
+            encoding="utf-8",
+        )
+        state = ServerState(
+            source_path=path,
+            state_path=state_path,
+            group_selector="g-pr01",
+            report_title=None,
+        )
+        html = state.render_html()
+        self.assertIn("data-status='reviewed'", html)
+        self.assertIn("handoff", html)
 
     def test_server_state_render_html_embeds_state_diff_report_when_state_is_provided(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            path = Path(tempdir) / "doc.diffgr.json"
-            state_path = Path(tempdir) / "state.json"
-            path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            state_path.write_text(
-                json.dumps(
-                    {"reviews": {"c1": {"status": "reviewed"}}, "groupBriefs": {}},
-                    ensure_ascii=False,
-                )
-                + "\n",
-                encoding="utf-8",
+        root = self._make_test_dir()
+        path = root / "doc.diffgr.json"
+        state_path = root / "state.json"
+        path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
+        state_path.write_text(
+            json.dumps(
+                {"reviews": {"c1": {"status": "reviewed"}}, "groupBriefs": {}},
+                ensure_ascii=False,
             )
-            server_state = ServerState(
-                source_path=path,
-                state_path=state_path,
-                group_selector="g-pr01",
-                lock=threading.Lock(),
-            )
-            html = server_state.render_html()
-            config = extract_report_config_json(html)
-            self.assertIsNotNone(config.get("stateDiffReport"))
-            self.assertEqual(config["stateDiffReport"]["sourceLabel"], "state.json")
-            self.assertIn("reviews:c1", config["stateDiffReport"]["selectionTokens"])
+            + "\n",
+            encoding="utf-8",
+        )
+        server_state = ServerState(
+            source_path=path,
+            state_path=state_path,
+            group_selector="g-pr01",
+        )
+        html = server_state.render_html()
+        config = extract_report_config_json(html)
+        self.assertIsNotNone(config.get("stateDiffReport"))
+        self.assertEqual(config["stateDiffReport"]["sourceLabel"], "state.json")
+        self.assertIn("reviews:c1", config["stateDiffReport"]["selectionTokens"])
 
     def test_server_state_render_html_embeds_impact_preview_when_configured(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            path = Path(tempdir) / "new.diffgr.json"
-            old_path = Path(tempdir) / "old.diffgr.json"
-            impact_state_path = Path(tempdir) / "impact.state.json"
-            new_doc = make_doc()
-            old_doc = make_doc()
-            new_doc["chunks"][0]["lines"][0]["text"] = "return a * 2;"
-            path.write_text(json.dumps(new_doc, ensure_ascii=False), encoding="utf-8")
-            old_path.write_text(json.dumps(old_doc, ensure_ascii=False), encoding="utf-8")
-            impact_state_path.write_text(
-                json.dumps({"groupBriefs": {"g-pr01": {"summary": "handoff"}}}, ensure_ascii=False),
-                encoding="utf-8",
-            )
-            state = ServerState(
-                source_path=path,
-                impact_old_path=old_path,
-                impact_state_path=impact_state_path,
-                group_selector="g-pr01",
-                lock=threading.Lock(),
-            )
-            html = state.render_html()
-            self.assertIn('id="toggle-impact-preview"', html)
-            self.assertIn("Impact</h3>", html)
-            self.assertIn("Group Brief Changes", html)
-            self.assertIn('"impactPreviewReport":', html)
-            self.assertIn("old.diffgr.json -&gt; new.diffgr.json using impact.state.json", html)
+        root = self._make_test_dir()
+        path = root / "new.diffgr.json"
+        old_path = root / "old.diffgr.json"
+        impact_state_path = root / "impact.state.json"
+        new_doc = make_doc()
+        old_doc = make_doc()
+        new_doc["chunks"][0]["lines"][0]["text"] = "return a * 2;"
+        path.write_text(json.dumps(new_doc, ensure_ascii=False), encoding="utf-8")
+        old_path.write_text(json.dumps(old_doc, ensure_ascii=False), encoding="utf-8")
+        impact_state_path.write_text(
+            json.dumps({"groupBriefs": {"g-pr01": {"summary": "handoff"}}}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        state = ServerState(
+            source_path=path,
+            impact_old_path=old_path,
+            impact_state_path=impact_state_path,
+            group_selector="g-pr01",
+        )
+        html = state.render_html()
+        self.assertIn('id="toggle-impact-preview"', html)
+        self.assertIn("Impact</h3>", html)
+        self.assertIn("Group Brief Changes", html)
+        self.assertIn('"impactPreviewReport":', html)
+        self.assertIn("old.diffgr.json -&gt; new.diffgr.json using impact.state.json", html)
 
     def test_server_state_render_html_rejects_mismatched_state_and_impact_state(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            path = Path(tempdir) / "new.diffgr.json"
-            old_path = Path(tempdir) / "old.diffgr.json"
-            state_path = Path(tempdir) / "view.state.json"
-            impact_state_path = Path(tempdir) / "impact.state.json"
-            path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            old_path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            state_path.write_text(json.dumps({"reviews": {}}, ensure_ascii=False), encoding="utf-8")
-            impact_state_path.write_text(json.dumps({"reviews": {}}, ensure_ascii=False), encoding="utf-8")
-            state = ServerState(
-                source_path=path,
-                state_path=state_path,
-                impact_old_path=old_path,
-                impact_state_path=impact_state_path,
-                group_selector="g-pr01",
-                lock=threading.Lock(),
-            )
-            with self.assertRaises(RuntimeError):
-                state.render_html()
+        root = self._make_test_dir()
+        path = root / "new.diffgr.json"
+        old_path = root / "old.diffgr.json"
+        state_path = root / "view.state.json"
+        impact_state_path = root / "impact.state.json"
+        path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
+        old_path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
+        state_path.write_text(json.dumps({"reviews": {}}, ensure_ascii=False), encoding="utf-8")
+        impact_state_path.write_text(json.dumps({"reviews": {}}, ensure_ascii=False), encoding="utf-8")
+        state = ServerState(
+            source_path=path,
+            state_path=state_path,
+            impact_old_path=old_path,
+            impact_state_path=impact_state_path,
+            group_selector="g-pr01",
+        )
+        with self.assertRaises(RuntimeError):
+            state.render_html()
 
     def test_server_state_save_state_writes_external_state_when_configured(self):
-        with tempfile.TemporaryDirectory() as tempdir:
-            path = Path(tempdir) / "doc.diffgr.json"
-            state_path = Path(tempdir) / "state.json"
-            path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            state = ServerState(
-                source_path=path,
-                state_path=state_path,
-                group_selector="g-pr01",
-                report_title=None,
-                lock=threading.Lock(),
-            )
-            result = state.save_state(
-                {
-                    "reviews": {"c1": {"status": "reviewed"}},
-                    "groupBriefs": {"g-pr01": {"summary": "handoff"}},
-                }
-            )
-            self.assertEqual(result["reviewChunkCount"], 1)
-            self.assertFalse("groupBriefs" in json.loads(path.read_text(encoding="utf-8")))
-            saved_state = json.loads(state_path.read_text(encoding="utf-8"))
-            self.assertEqual(saved_state["reviews"]["c1"]["status"], "reviewed")
-            self.assertEqual(saved_state["groupBriefs"]["g-pr01"]["summary"], "handoff")
+        root = self._make_test_dir()
+        path = root / "doc.diffgr.json"
+        state_path = root / "state.json"
+        path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
+        state = ServerState(
+            source_path=path,
+            state_path=state_path,
+            group_selector="g-pr01",
+            report_title=None,
+        )
+        result = state.save_state(
+            {
+                "reviews": {"c1": {"status": "reviewed"}},
+                "groupBriefs": {"g-pr01": {"summary": "handoff"}},
+            }
+        )
+        self.assertEqual(result["reviewChunkCount"], 1)
+        self.assertRegex(result["savedAt"], r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+        self.assertFalse("groupBriefs" in json.loads(path.read_text(encoding="utf-8")))
+        saved_state = json.loads(state_path.read_text(encoding="utf-8"))
+        self.assertEqual(saved_state["reviews"]["c1"]["status"], "reviewed")
+        self.assertEqual(saved_state["groupBriefs"]["g-pr01"]["summary"], "handoff")
 
 
 if __name__ == "__main__":
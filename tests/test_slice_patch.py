@@ -1,4 +1,3 @@
-import copy
 import unittest
 
 from diffgr.slice_patch import apply_slice_patch
@@ -24,9 +23,8 @@ def make_doc():
 
 class TestSlicePatch(unittest.TestCase):
     def test_apply_slice_patch_renames_and_moves(self):
-        doc = make_doc()
         patch = {"rename": {"g1": "計算", "g2": "正規化"}, "move": [{"chunk": "c2", "to": "g2"}]}
-        new_doc = apply_slice_patch(copy.deepcopy(doc), patch)
+        new_doc = apply_slice_patch(make_doc(), patch)
         names = {g["id"]: g["name"] for g in new_doc["groups"]}
         self.assertEqual(names["g1"], "計算")
         self.assertEqual(names["g2"], "正規化")
@@ -34,17 +32,16 @@ class TestSlicePatch(unittest.TestCase):
         self.assertEqual(new_doc["assignments"]["g2"], ["c2"])
 
     def test_apply_slice_patch_rejects_unknown_ids(self):
-        doc = make_doc()
         with self.assertRaises(RuntimeError):
-            apply_slice_patch(copy.deepcopy(doc), {"move": [{"chunk": "c99", "to": "g2"}]})
+            apply_slice_patch(make_doc(), {"move": [{"chunk": "c99", "to": "g2"}]})
         with self.assertRaises(RuntimeError):
-            apply_slice_patch(copy.deepcopy(doc), {"move": [{"chunk": "c1", "to": "g99"}]})
+            apply_slice_patch(make_doc(), {"move": [{"chunk": "c1", "to": "g99"}]})
 
     def test_apply_slice_patch_prunes_groups_that_become_empty(self):
         doc = make_doc()
         doc["assignments"] = {"g1": ["c1"], "g2": ["c2"]}
 
-        new_doc = apply_slice_patch(copy.deepcopy(doc), {"move": [{"chunk": "c2", "to": "g1"}]})
+        new_doc = apply_slice_patch(doc, {"move": [{"chunk": "c2", "to": "g1"}]})
 
         self.assertEqual([group["id"] for group in new_doc["groups"]], ["g1"])
         self.assertEqual(new_doc["assignments"], {"g1": ["c1", "c2"]})
@@ -6,18 +6,16 @@ import unittest
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-from scripts.apply_diffgr_state import main as apply_state_main  # noqa: E402
-from scripts.apply_diffgr_state_diff import main as apply_state_diff_main  # noqa: E402
-from scripts.diff_diffgr_state import main as diff_state_main  # noqa: E402
-from scripts.extract_diffgr_state import main as extract_state_main  # noqa: E402
-from scripts.merge_diffgr_state import main as merge_state_main  # noqa: E402
-from scripts.preview_rebased_merge import main as preview_rebased_merge_main  # noqa: E402
-from scripts.rebase_diffgr_state import main as rebase_state_main  # noqa: E402
-from scripts.summarize_diffgr_state import main as summarize_state_main  # noqa: E402
+from tests import _testpath  # noqa: F401
+
+from scripts.apply_diffgr_state import main as apply_state_main
+from scripts.apply_diffgr_state_diff import main as apply_state_diff_main
+from scripts.diff_diffgr_state import main as diff_state_main
+from scripts.extract_diffgr_state import main as extract_state_main
+from scripts.merge_diffgr_state import main as merge_state_main
+from scripts.preview_rebased_merge import main as preview_rebased_merge_main
+from scripts.rebase_diffgr_state import main as rebase_state_main
+from scripts.summarize_diffgr_state import main as summarize_state_main
 
 
 def make_doc() -> dict:
@@ -1,12 +1,9 @@
 import os
-import sys
 import tempfile
 import unittest
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from tests import _testpath  # noqa: F401
 
 from diffgr import viewer_core as view_diffgr
 
@@ -52,26 +49,79 @@ def make_doc():
     }
 
 
-class TestViewDiffgr(unittest.TestCase):
-    def test_validate_document_accepts_valid_doc(self):
-        warnings = view_diffgr.validate_document(make_doc())
-        self.assertEqual(warnings, [])
+def _add_unknown_refs(doc):
+    doc["assignments"]["ghost"] = ["c1"]
+    doc["assignments"]["g1"].append("missing")
+    doc["reviews"]["missing-review"] = {"status": "reviewed"}
 
-    def test_validate_document_reports_warnings_for_unknown_refs(self):
-        doc = make_doc()
-        doc["assignments"]["ghost"] = ["c1"]
-        doc["assignments"]["g1"].append("missing")
-        doc["reviews"]["missing-review"] = {"status": "reviewed"}
-        warnings = view_diffgr.validate_document(doc)
-        self.assertTrue(any("Assignment key not in groups: ghost" in item for item in warnings))
-        self.assertTrue(any("Assigned chunk id not found: missing" in item for item in warnings))
-        self.assertTrue(any("Review key chunk id not found: missing-review" in item for item in warnings))
-
-    def test_validate_document_warns_when_group_assignments_key_missing(self):
-        doc = make_doc()
-        doc["assignments"].pop("g2", None)
-        warnings = view_diffgr.validate_document(doc)
-        self.assertTrue(any("Group missing assignments entry: g2" in item for item in warnings))
+
+def _drop_g2_assignments(doc):
+    doc["assignments"].pop("g2", None)
+
+
+def _drop_all_assignments(doc):
+    doc["assignments"] = {}
+
+
+def _duplicate_ids(doc):
+    doc["groups"].append({"id": "g1", "name": "Again", "order": 3})
+    doc["chunks"].append(dict(doc["chunks"][0]))
+
+
+_VALIDATE_DOCUMENT_CASES = (
+    ("valid", lambda doc: None, []),
+    (
+        "unknown refs",
+        _add_unknown_refs,
+        [
+            "Assigned chunk id not found: missing",
+            "Assignment key not in groups: ghost",
+            "Review key chunk id not found: missing-review",
+        ],
+    ),
+    ("missing assignments key", _drop_g2_assignments, ["Group missing assignments entry: g2"]),
+    (
+        "missing assignments keys in group order",
+        _drop_all_assignments,
+        ["Group missing assignments entry: g1", "Group missing assignments entry: g2"],
+    ),
+    ("duplicate ids", _duplicate_ids, ["Duplicate group ids detected.", "Duplicate chunk ids detected."]),
+)
+
+
+def _add_unassigned_invalid_status_chunk(doc: dict) -> None:
+    doc["chunks"].append({"id": "c4", "filePath": "src/d.ts", "lines": []})
+    doc["reviews"]["c4"] = {"status": "bogus"}
+
+
+def _use_non_string_chunk_id(doc: dict) -> None:
+    # validate_document only warns about these ids, so metrics must match the separate passes.
+    doc["chunks"] = [{"id": 1, "filePath": "src/a.ts", "lines": []}, {"id": "c2", "filePath": "src/b.ts", "lines": []}]
+    doc["assignments"] = {"g1": [1], "g2": []}
+    doc["reviews"] = {}
+
+
+def _use_empty_chunk_id(doc: dict) -> None:
+    doc["chunks"] = [{"id": "", "filePath": "src/a.ts", "lines": []}, {"id": "c2", "filePath": "src/b.ts", "lines": []}]
+    doc["assignments"] = {"g1": ["c2"], "g2": []}
+    doc["reviews"] = {}
+
+
+_METRICS_CASES = (
+    # (name, mutate, expected Unassigned, Pending, Tracked)
+    ("unassigned invalid status", _add_unassigned_invalid_status_chunk, 1, 2, 3),
+    ("non-string chunk id", _use_non_string_chunk_id, 1, 1, 2),
+    ("empty chunk id", _use_empty_chunk_id, 1, 1, 2),
+)
+
+
+class TestViewDiffgr(unittest.TestCase):
+    def test_validate_document_warnings(self):
+        for name, mutate, expected in _VALIDATE_DOCUMENT_CASES:
+            with self.subTest(name):
+                doc = make_doc()
+                mutate(doc)
+                self.assertEqual(view_diffgr.validate_document(doc), expected)
 
     def test_build_indexes_defaults_invalid_status_to_unreviewed(self):
         doc = make_doc()
@@ -90,6 +140,25 @@ class TestViewDiffgr(unittest.TestCase):
         self.assertEqual(metrics["Pending"], 1)
         self.assertAlmostEqual(metrics["CoverageRate"], 0.5)
 
+    def test_compute_metrics_edge_case_chunk_ids(self):
+        for name, mutate, unassigned, pending, tracked in _METRICS_CASES:
+            with self.subTest(name):
+                doc = make_doc()
+                mutate(doc)
+                _chunk_map, status_map = view_diffgr.build_indexes(doc)
+                metrics = view_diffgr.compute_metrics(doc, status_map)
+                self.assertEqual((metrics["Unassigned"], metrics["Pending"], metrics["Tracked"]), (unassigned, pending, tracked))
+
+    def test_compute_metrics_accepts_precomputed_assigned_set(self):
+        doc = make_doc()
+        _chunk_map, status_map = view_diffgr.build_indexes(doc)
+        assigned = view_diffgr.assigned_chunk_set(doc)
+        self.assertEqual(assigned, {"c1", "c2", "c3"})
+        self.assertEqual(
+            view_diffgr.compute_metrics(doc, status_map, assigned),
+            view_diffgr.compute_metrics(doc, status_map),
+        )
+
     def test_filter_chunks_by_group_status_and_file(self):
         doc = make_doc()
         chunk_map, status_map = view_diffgr.build_indexes(doc)
@@ -105,6 +174,44 @@ class TestViewDiffgr(unittest.TestCase):
         self.assertEqual(len(filtered), 1)
         self.assertEqual(filtered[0]["id"], "c2")
 
+    def test_filter_chunks_by_chunk_id_respects_group(self):
+        doc = make_doc()
+        chunk_map, status_map = view_diffgr.build_indexes(doc)
+
+        def run(group_id, chunk_id):
+            return view_diffgr.filter_chunks(
+                doc=doc,
+                chunk_map=chunk_map,
+                status_map=status_map,
+                group_id=group_id,
+                chunk_id=chunk_id,
+                status_filter=None,
+                file_contains=None,
+            )
+
+        self.assertEqual([item["id"] for item in run(None, "c3")], ["c3"])
+        self.assertEqual([item["id"] for item in run("g1", "c2")], ["c2"])
+        self.assertEqual(run("g1", "c3"), [])
+        self.assertEqual(run(None, "missing"), [])
+
+    def test_filter_chunks_uses_file_path_index(self):
+        doc = make_doc()
+        doc["chunks"][1]["filePath"] = "src/Beta.ts"
+        chunk_map, status_map = view_diffgr.build_indexes(doc)
+        index = view_diffgr.build_file_path_index(chunk_map)
+        self.assertEqual(index["c2"], "src/beta.ts")
+        filtered = view_diffgr.filter_chunks(
+            doc=doc,
+            chunk_map=chunk_map,
+            status_map=status_map,
+            group_id=None,
+            chunk_id=None,
+            status_filter=None,
+            file_contains="BETA",
+            file_path_index=index,
+        )
+        self.assertEqual([item["id"] for item in filtered], ["c2"])
+
     def test_filter_chunks_raises_for_unknown_group(self):
         doc = make_doc()
         chunk_map, status_map = view_diffgr.build_indexes(doc)
@@ -1,7 +1,6 @@
 import json
 import io
 import os
-import sys
 import tempfile
 import unittest
 from contextlib import redirect_stderr, redirect_stdout
@@ -10,9 +9,7 @@ from unittest import mock
 
 from rich.console import Console
 
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+from tests._testpath import ROOT
 
 from diffgr import viewer_app as view_diffgr_app
 from diffgr import viewer_render
@@ -46,6 +43,18 @@ def make_doc() -> dict:
 
 
 class TestViewDiffgrApp(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Output that no assertion reads goes to one shared os.devnull handle.
+        cls._devnull = open(os.devnull, "w", encoding="utf-8")
+        cls.addClassCleanup(cls._devnull.close)
+
+    def setUp(self):
+        # run_app loads through the on-disk document cache; keep it off the user's cache directory.
+        cache_env = mock.patch.dict(os.environ, {"DIFFGR_CACHE_DIR": ""})
+        cache_env.start()
+        self.addCleanup(cache_env.stop)
+
     def test_parse_args_defaults(self):
         args = view_diffgr_app.parse_app_args(["sample.diffgr.json"])
         self.assertEqual(args.path, "sample.diffgr.json")
@@ -62,7 +71,7 @@ class TestViewDiffgrApp(unittest.TestCase):
         with tempfile.TemporaryDirectory() as tmp:
             file_path = Path(tmp) / "doc.diffgr.json"
             file_path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            with redirect_stdout(self._devnull), redirect_stderr(self._devnull):
                 code = view_diffgr_app.run_app([str(file_path), "--once", "--page-size", "5", "--ui", "prompt"])
             self.assertEqual(code, 0)
 
@@ -84,7 +93,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 encoding="utf-8",
             )
             stdout = io.StringIO()
-            with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+            with redirect_stdout(stdout), redirect_stderr(self._devnull):
                 code = view_diffgr_app.run_app(
                     [str(file_path), "--state", str(state_path), "--once", "--page-size", "5", "--ui", "prompt"]
                 )
@@ -92,7 +101,7 @@ class TestViewDiffgrApp(unittest.TestCase):
             self.assertIn("reviewed", stdout.getvalue())
 
     def test_run_with_missing_file_returns_error(self):
-        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+        with redirect_stdout(self._devnull), redirect_stderr(self._devnull):
             code = view_diffgr_app.run_app(["not-found.diffgr.json", "--once", "--ui", "prompt"])
         self.assertEqual(code, 1)
 
@@ -100,21 +109,27 @@ class TestViewDiffgrApp(unittest.TestCase):
         with tempfile.TemporaryDirectory() as tmp:
             file_path = Path(tmp) / "doc.diffgr.json"
             file_path.write_text(json.dumps(make_doc(), ensure_ascii=False), encoding="utf-8")
-            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            with redirect_stdout(self._devnull), redirect_stderr(self._devnull):
                 code = view_diffgr_app.run_app([str(file_path), "--once", "--page-size", "0", "--ui", "prompt"])
             self.assertEqual(code, 2)
 
     def test_run_once_resolves_path_with_repo_root_fallback(self):
         old_cwd = Path.cwd()
-        try:
-            os.chdir(ROOT / "scripts")
-            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
-                code = view_diffgr_app.run_app(
-                    ["samples/diffgr/ts20-5pr.named.diffgr.json", "--once", "--page-size", "5", "--ui", "prompt"]
-                )
-        finally:
-            os.chdir(old_cwd)
-        self.assertEqual(code, 0)
+        argv = ["samples/diffgr/ts20-5pr.named.diffgr.json", "--once", "--page-size", "5", "--ui", "prompt"]
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.dict(os.environ, {"DIFFGR_CACHE_DIR": tmp}):
+            try:
+                os.chdir(ROOT / "scripts")
+                with redirect_stdout(self._devnull), redirect_stderr(self._devnull):
+                    first_code = view_diffgr_app.run_app(argv)
+                    with mock.patch("diffgr.doc_cache.load_json") as load_json:
+                        second_code = view_diffgr_app.run_app(argv)
+            finally:
+                os.chdir(old_cwd)
+            cache_entries = list(Path(tmp).glob("*.json"))
+        self.assertEqual((first_code, second_code), (0, 0))
+        # The second run is served from the document cache written by the first.
+        load_json.assert_not_called()
+        self.assertEqual(len(cache_entries), 1)
 
     def test_prompt_ui_save_writes_external_state_when_state_path_is_given(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -146,7 +161,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 ],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--state", str(state_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             self.assertEqual(file_path.read_text(encoding="utf-8"), original_text)
@@ -181,7 +196,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 "ask",
                 side_effect=["group g-all", "status reviewed", "file src/a", "detail c1", "save", "quit"],
             ):
-                with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                with redirect_stdout(self._devnull), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--state", str(state_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             payload = json.loads(state_path.read_text(encoding="utf-8"))
@@ -199,7 +214,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 "ask",
                 side_effect=["set-status c1 needsReReview", "save", "quit"],
             ):
-                with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                with redirect_stdout(self._devnull), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             written = json.loads(file_path.read_text(encoding="utf-8"))
@@ -220,7 +235,7 @@ class TestViewDiffgrApp(unittest.TestCase):
             file_path.write_text(json.dumps(doc, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["detail c1", "quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -253,7 +268,7 @@ class TestViewDiffgrApp(unittest.TestCase):
             file_path.write_text(json.dumps(doc, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["brief-show g-all", "quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -311,7 +326,7 @@ class TestViewDiffgrApp(unittest.TestCase):
             )
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--state", str(state_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -333,7 +348,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                     "quit",
                 ],
             ):
-                with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                with redirect_stdout(self._devnull), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--state", str(state_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             payload = json.loads(state_path.read_text(encoding="utf-8"))
@@ -361,7 +376,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 ],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -372,6 +387,23 @@ class TestViewDiffgrApp(unittest.TestCase):
             self.assertIn("group=g-all", output)
             self.assertIn("chunk=c1", output)
 
+    def test_prompt_ui_metrics_reuse_assigned_chunk_set(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = Path(tmp) / "doc.diffgr.json"
+            file_path.write_text(json.dumps(make_doc(), ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            assigned_chunk_set = mock.Mock(wraps=view_diffgr_app.assigned_chunk_set)
+            with mock.patch.object(
+                view_diffgr_app.Prompt,
+                "ask",
+                side_effect=["metrics", "set-status c1 reviewed", "metrics", "quit"],
+            ), mock.patch.object(view_diffgr_app, "assigned_chunk_set", assigned_chunk_set), mock.patch(
+                "diffgr.viewer_core.assigned_chunk_set", assigned_chunk_set
+            ):
+                with redirect_stdout(self._devnull), redirect_stderr(self._devnull):
+                    code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
+            self.assertEqual(code, 0)
+            assigned_chunk_set.assert_called_once()
+
     def test_prompt_ui_state_show_includes_bound_state_path(self):
         with tempfile.TemporaryDirectory() as tmp:
             file_path = Path(tmp) / "doc.diffgr.json"
@@ -380,7 +412,7 @@ class TestViewDiffgrApp(unittest.TestCase):
             state_path.write_text(json.dumps({"reviews": {}}, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["state-show", "quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--state", str(state_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -397,7 +429,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=[f"state-bind {state_path}", "set-status c1 reviewed", "state-save-as", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             payload = json.loads(state_path.read_text(encoding="utf-8"))
@@ -416,7 +448,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=["state-unbind", "state-diff", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--state", str(state_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -439,7 +471,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 ],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             payload = json.loads(export_path.read_text(encoding="utf-8"))
@@ -459,7 +491,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=["group g-all", "set-status c1 reviewed", "state-save-as", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--state", str(state_path), "--ui", "prompt"])
 
             self.assertEqual(code, 0)
@@ -504,7 +536,7 @@ class TestViewDiffgrApp(unittest.TestCase):
             )
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=[f"state-load {state_path}", "brief-show g-all", "quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -525,7 +557,7 @@ class TestViewDiffgrApp(unittest.TestCase):
             )
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["state-load", "quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--state", str(state_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -556,7 +588,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=["set-status c1 needsReReview", f"state-diff {state_path}", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -588,7 +620,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=["set-status c1 needsReReview", "state-diff", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--state", str(state_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -625,7 +657,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=["set-status c1 reviewed", f"state-merge {state_path}", "brief-show g-all", "state-show", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -650,7 +682,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=[f"state-bind {first_state}", f"state-bind {second_state}", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -672,7 +704,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=["set-status c1 reviewed", "state-merge", "state-show", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--state", str(state_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -704,7 +736,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=[f"state-merge-preview {state_path}", "state-show", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -736,7 +768,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=[f"state-merge-preview {state_path}", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -775,7 +807,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=[f"impact-merge-preview {old_path} {new_path} {state_path}", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -816,7 +848,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=[f"impact-apply-preview {old_path} {new_path} {state_path} handoffs", "state-show", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -856,7 +888,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=[f"impact-apply {old_path} {new_path} {state_path} handoffs", "state-show", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -882,7 +914,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=[f"impact-apply {old_path} {new_path} {state_path} ui", "state-show", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -917,7 +949,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=[f"state-apply {state_path} reviews:c1", "state-show", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -943,7 +975,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=[f"state-apply-preview {state_path} reviews:c1", "state-show", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -966,7 +998,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=["state-apply reviews:c1", "state-show", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--state", str(state_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -991,7 +1023,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=[f'state-apply {state_path} "threadState.__files:src/my file.ts"', "state-show", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -1038,7 +1070,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 side_effect=[f"state-load {state_path}", "state-reset", "state-show", "quit"],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
             self.assertEqual(code, 0)
             output = stdout.getvalue()
@@ -1330,7 +1362,7 @@ class TestViewDiffgrApp(unittest.TestCase):
 
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["state-load missing.state.json", "quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
 
             self.assertEqual(code, 0)
@@ -1359,7 +1391,7 @@ class TestViewDiffgrApp(unittest.TestCase):
 
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["wat", "quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
 
             self.assertEqual(code, 0)
@@ -1374,7 +1406,7 @@ class TestViewDiffgrApp(unittest.TestCase):
 
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["line-comment c1 - 2 meta note", "quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
 
             self.assertEqual(code, 0)
@@ -1387,7 +1419,7 @@ class TestViewDiffgrApp(unittest.TestCase):
 
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["line-comment c1 0 2 add note", "quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
 
             self.assertEqual(code, 0)
@@ -1400,7 +1432,7 @@ class TestViewDiffgrApp(unittest.TestCase):
 
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["brief-meta g-all nope value", "quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
 
             self.assertEqual(code, 0)
@@ -1413,7 +1445,7 @@ class TestViewDiffgrApp(unittest.TestCase):
 
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["brief-list g-all nope value", "quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
 
             self.assertEqual(code, 0)
@@ -1427,7 +1459,7 @@ class TestViewDiffgrApp(unittest.TestCase):
             with mock.patch.object(view_diffgr_app, "_save_prompt_document", side_effect=RuntimeError("boom")):
                 with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["save", "quit"]):
                     stdout = io.StringIO()
-                    with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                    with redirect_stdout(stdout), redirect_stderr(self._devnull):
                         code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
 
             self.assertEqual(code, 0)
@@ -1468,7 +1500,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 ],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
 
             self.assertEqual(code, 0)
@@ -1504,7 +1536,7 @@ class TestViewDiffgrApp(unittest.TestCase):
 
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["state-merge missing.state.json", "quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
 
             self.assertEqual(code, 0)
@@ -1517,7 +1549,7 @@ class TestViewDiffgrApp(unittest.TestCase):
 
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["state-apply missing.state.json reviews:c1", "quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
 
             self.assertEqual(code, 0)
@@ -1530,7 +1562,7 @@ class TestViewDiffgrApp(unittest.TestCase):
 
             with mock.patch.object(view_diffgr_app.Prompt, "ask", side_effect=["state-diff missing.state.json", "quit"]):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
 
             self.assertEqual(code, 0)
@@ -1562,7 +1594,7 @@ class TestViewDiffgrApp(unittest.TestCase):
                 ],
             ):
                 stdout = io.StringIO()
-                with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                with redirect_stdout(stdout), redirect_stderr(self._devnull):
                     code = view_diffgr_app.run_app([str(file_path), "--ui", "prompt"])
 
             self.assertEqual(code, 0)
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from diffgr.viewer_core import build_chunk_map
+import datetime
+import json
+import math
+import os
+from pathlib import Path
+
+import pytest
+
+from diffgr import viewer_core
+from diffgr.viewer_core import build_chunk_map, load_json, parse_simple_flags, write_json_atomic
 
 
 class TestBuildChunkMap:
@@ -62,3 +71,96 @@ class TestBuildChunkMap:
     def test_none_chunks_key(self):
         doc = {"chunks": None}
         assert build_chunk_map(doc) == {}
+
+
+class TestParseSimpleFlags:
+    def test_parses_values_switches_and_defaults(self):
+        args = parse_simple_flags(
+            ["--input", "a.json", "--include-empty"],
+            options={"--input": None, "--output-dir": "out", "--manifest": "manifest.json"},
+            switches=("--include-empty", "--json"),
+            required=("--input",),
+        )
+        assert args is not None
+        assert args.input == "a.json"
+        assert args.output_dir == "out"
+        assert args.manifest == "manifest.json"
+        assert args.include_empty is True
+        assert args.json is False
+
+    def test_returns_none_for_argparse_fallback(self):
+        options = {"--input": None}
+        assert parse_simple_flags(["--help"], options=options) is None
+        assert parse_simple_flags(["--input=a.json"], options=options) is None
+        assert parse_simple_flags(["--input"], options=options) is None
+        assert parse_simple_flags(["--input", "--json"], options=options, switches=("--json",)) is None
+        assert parse_simple_flags([], options=options, required=("--input",)) is None
+
+
+class TestWriteJsonAtomic:
+    def test_replaces_file_and_keeps_mode(self, tmp_path: Path):
+        path = tmp_path / "doc.json"
+        path.write_text("{}", encoding="utf-8")
+        os.chmod(path, 0o640)
+        write_json_atomic(path, {"title": "日本語"})
+        assert json.loads(path.read_text(encoding="utf-8")) == {"title": "日本語"}
+        assert path.read_text(encoding="utf-8").endswith("\n")
+        assert oct(path.stat().st_mode & 0o777) == oct(0o640)
+        assert [item.name for item in tmp_path.iterdir()] == ["doc.json"]
+
+    def test_failed_serialization_leaves_original(self, tmp_path: Path):
+        path = tmp_path / "doc.json"
+        path.write_text('{"keep": true}', encoding="utf-8")
+        with pytest.raises(TypeError):
+            write_json_atomic(path, {"bad": object()})
+        assert json.loads(path.read_text(encoding="utf-8")) == {"keep": True}
+        assert [item.name for item in tmp_path.iterdir()] == ["doc.json"]
+
+
+class TestJsonCodec:
+    @pytest.mark.parametrize("accelerated", [True, False])
+    def test_load_json_and_pretty_dump_match_stdlib(self, tmp_path: Path, monkeypatch, accelerated: bool):
+        if not accelerated:
+            monkeypatch.setattr(viewer_core, "orjson", None)
+        elif viewer_core.orjson is None:
+            pytest.skip("orjson is not installed")
+        obj = {"title": "日本語", "lines": [{"n": 1, "rate": 0.5}], "empty": {}, "big": 2**70}
+        path = tmp_path / "doc.json"
+        path.write_text(json.dumps(obj, ensure_ascii=False), encoding="utf-8")
+        assert load_json(path) == obj
+        assert viewer_core._dumps_pretty({"a": [1, {"b": "ü"}], "c": {}}) == json.dumps(
+            {"a": [1, {"b": "ü"}], "c": {}}, ensure_ascii=False, indent=2
+        )
+        assert viewer_core._dumps_pretty({1: "x"}) == json.dumps({1: "x"}, ensure_ascii=False, indent=2)
+        viewer_core.write_json(path, {"a": [1, {"b": "ü"}], "c": {}})
+        assert path.read_text(encoding="utf-8") == json.dumps(
+            {"a": [1, {"b": "ü"}], "c": {}}, ensure_ascii=False, indent=2
+        ) + "\n"
+
+    def test_pretty_dump_is_stdlib_output_even_with_orjson(self):
+        obj = {"exp": [1e16, 1e-7, 1e22], "rate": 0.1}
+        assert viewer_core._dumps_pretty(obj) == json.dumps(obj, ensure_ascii=False, indent=2)
+        with pytest.raises(TypeError):
+            viewer_core._dumps_pretty({"when": datetime.date(2024, 1, 1)})
+
+    @pytest.mark.parametrize("accelerated", [True, False])
+    def test_write_json_keeps_non_finite_floats_and_lf_endings(self, tmp_path: Path, monkeypatch, accelerated: bool):
+        if not accelerated:
+            monkeypatch.setattr(viewer_core, "orjson", None)
+        elif viewer_core.orjson is None:
+            pytest.skip("orjson is not installed")
+        path = tmp_path / "doc.json"
+        viewer_core.write_json(path, {"scores": [float("nan"), float("inf"), 1.5]})
+        raw = path.read_bytes()
+        assert b"\r\n" not in raw
+        assert raw == (json.dumps({"scores": [float("nan"), float("inf"), 1.5]}, indent=2) + "\n").encode("utf-8")
+        scores = load_json(path)["scores"]
+        assert math.isnan(scores[0]) and scores[1:] == [float("inf"), 1.5]
+        write_json_atomic(path, {"scores": [float("-inf"), 1e16]})
+        assert path.read_text(encoding="utf-8") == '{\n  "scores": [\n    -Infinity,\n    1e+16\n  ]\n}\n'
+
+    def test_load_json_reports_invalid_json(self, tmp_path: Path):
+        path = tmp_path / "bad.json"
+        path.write_text("{", encoding="utf-8")
+        with pytest.raises(RuntimeError, match="Invalid JSON"):
+            load_json(path)
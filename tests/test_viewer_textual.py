@@ -7,6 +7,7 @@ import unittest
 from pathlib import Path
 from unittest import mock
 
+from tests._tempdir import ClassTempDirMixin
 from diffgr.viewer_textual import DiffgrTextualApp, build_group_diff_report_rows, format_file_label, normalize_editor_mode
 from diffgr.review_state import load_review_state, review_state_fingerprint
 from textual.widgets import DataTable
@@ -33,36 +34,78 @@ def make_chunk(
     }
 
 
-class TestViewerTextualReport(unittest.TestCase):
+class _StubLinesTable:
+    """Records the column rebuilds ``_switch_lines_table_mode`` makes on the lines table."""
+
+    def __init__(self) -> None:
+        self.ordered_columns: list[str] = []
+        self.clear_calls: list[bool] = []
+
+    def clear(self, *, columns: bool) -> None:
+        self.clear_calls.append(columns)
+        if columns:
+            self.ordered_columns = []
+
+    def add_columns(self, *names: str) -> None:
+        self.ordered_columns = list(names)
+
+    def add_column(self, name: str, **_kwargs) -> None:
+        self.ordered_columns.append(name)
+
+
+_SIDE_BY_SIDE_COLUMNS = ("old#", "old", "new#", "new")
+
+_SWITCH_LINES_TABLE_MODE_CASES = (
+    # (name, current mode, current side-by-side widths, current columns, report text widths, target mode,
+    #  expected (clear calls, columns, side-by-side widths) afterwards)
+    ("rebuilds missing columns", "chunk", None, (), (42, 42), "chunk", ([True], ["old", "new", "kind", "content"], None)),
+    (
+        "side by side uses old/new four columns",
+        "chunk_compact",
+        None,
+        (),
+        (42, 42),
+        "chunk_side_by_side",
+        ([True], list(_SIDE_BY_SIDE_COLUMNS), (42, 42)),
+    ),
+    (
+        "side by side rebuilds when width changes",
+        "chunk_side_by_side",
+        (40, 40),
+        _SIDE_BY_SIDE_COLUMNS,
+        (46, 34),
+        "chunk_side_by_side",
+        ([True], list(_SIDE_BY_SIDE_COLUMNS), (46, 34)),
+    ),
+    (
+        "side by side skips rebuild when width same",
+        "chunk_side_by_side",
+        (40, 40),
+        _SIDE_BY_SIDE_COLUMNS,
+        (40, 40),
+        "chunk_side_by_side",
+        ([False], list(_SIDE_BY_SIDE_COLUMNS), (40, 40)),
+    ),
+)
+
+
+class TestViewerTextualReport(ClassTempDirMixin, unittest.TestCase):
     def _make_key_test_app(self, *, initial_status: str = "unreviewed") -> tuple[DiffgrTextualApp, dict[str, str]]:
         doc = {"groups": [], "assignments": {}, "meta": {"title": "KeyTest"}, "reviews": {}}
         chunk_map = {
-            "c1": {
-                "id": "c1",
-                "filePath": "src/a.ts",
-                "old": {"start": 1, "count": 1},
-                "new": {"start": 1, "count": 1},
-                "header": "h1",
-                "lines": [],
-            },
-            "c2": {
-                "id": "c2",
-                "filePath": "src/a.ts",
-                "old": {"start": 2, "count": 1},
-                "new": {"start": 2, "count": 1},
-                "header": "h2",
-                "lines": [],
-            },
-            "c3": {
-                "id": "c3",
-                "filePath": "src/a.ts",
-                "old": {"start": 3, "count": 1},
-                "new": {"start": 3, "count": 1},
-                "header": "h3",
-                "lines": [],
-            },
+            f"c{line}": make_chunk(
+                chunk_id=f"c{line}",
+                file_path="src/a.ts",
+                old_start=line,
+                old_count=1,
+                new_start=line,
+                new_count=1,
+                header=f"h{line}",
+                lines=[],
+            )
+            for line in (1, 2, 3)
         }
-        status_map = {chunk_id: initial_status for chunk_id in chunk_map}
+        status_map = dict.fromkeys(chunk_map, initial_status)
         app = DiffgrTextualApp(Path("dummy.diffgr.json"), doc, [], chunk_map, status_map, 15)
         return app, status_map
 
@@ -71,49 +114,35 @@ class TestViewerTextualReport(unittest.TestCase):
             return str(getattr(value, "plain"))
         return str(value)
 
-    def test_space_key_marks_done_in_runtime_and_updates_done_column(self):
+    def test_space_and_backspace_keys_toggle_done_in_runtime(self):
+        # One pilot session covers mark, toggle back and backspace; each step starts from the last.
         app, status_map = self._make_key_test_app(initial_status="unreviewed")
-        done_cell = ""
 
         async def _run() -> None:
-            nonlocal done_cell
             async with app.run_test() as pilot:
+                table = app.query_one("#chunks", DataTable)
                 await pilot.press("c")
                 await pilot.press("space")
                 await pilot.pause()
-                table = app.query_one("#chunks", DataTable)
-                done_cell = self._cell_text(table.get_cell_at((0, 1)))
-
-        asyncio.run(_run())
-        self.assertEqual(status_map["c1"], "reviewed")
-        self.assertEqual(done_cell, "[✅]")
-
-    def test_shift_space_key_marks_done_in_runtime(self):
-        app, status_map = self._make_key_test_app(initial_status="unreviewed")
+                self.assertEqual(status_map["c1"], "reviewed")
+                self.assertEqual(self._cell_text(table.get_cell_at((0, 1))), "[✅]")
 
-        async def _run() -> None:
-            async with app.run_test() as pilot:
-                await pilot.press("c")
-                await pilot.press("shift+space")
+                await pilot.press("space")
                 await pilot.pause()
+                self.assertEqual(status_map["c1"], "unreviewed")
 
-        asyncio.run(_run())
-        self.assertEqual(status_map["c1"], "reviewed")
-
-    def test_space_key_toggles_done_to_undone_in_runtime(self):
-        app, status_map = self._make_key_test_app(initial_status="reviewed")
-
-        async def _run() -> None:
-            async with app.run_test() as pilot:
-                await pilot.press("c")
                 await pilot.press("space")
                 await pilot.pause()
+                self.assertEqual(status_map["c1"], "reviewed")
+                await pilot.press("backspace")
+                await pilot.pause()
+                self.assertEqual(status_map["c1"], "unreviewed")
+                self.assertEqual(self._cell_text(table.get_cell_at((0, 1))), "[  ]")
 
         asyncio.run(_run())
-        self.assertEqual(status_map["c1"], "unreviewed")
 
-    def test_shift_space_key_keeps_done_when_already_done_in_runtime(self):
-        app, status_map = self._make_key_test_app(initial_status="reviewed")
+    def test_shift_space_key_marks_done_in_runtime(self):
+        app, status_map = self._make_key_test_app(initial_status="unreviewed")
 
         async def _run() -> None:
             async with app.run_test() as pilot:
@@ -124,22 +153,17 @@ class TestViewerTextualReport(unittest.TestCase):
         asyncio.run(_run())
         self.assertEqual(status_map["c1"], "reviewed")
 
-    def test_backspace_key_marks_undone_in_runtime(self):
+    def test_shift_space_key_keeps_done_when_already_done_in_runtime(self):
         app, status_map = self._make_key_test_app(initial_status="reviewed")
-        done_cell = ""
 
         async def _run() -> None:
-            nonlocal done_cell
             async with app.run_test() as pilot:
                 await pilot.press("c")
-                await pilot.press("backspace")
+                await pilot.press("shift+space")
                 await pilot.pause()
-                table = app.query_one("#chunks", DataTable)
-                done_cell = self._cell_text(table.get_cell_at((0, 1)))
 
         asyncio.run(_run())
-        self.assertEqual(status_map["c1"], "unreviewed")
-        self.assertEqual(done_cell, "[  ]")
+        self.assertEqual(status_map["c1"], "reviewed")
 
     def test_space_marks_selected_range_done_in_runtime(self):
         app, status_map = self._make_key_test_app(initial_status="unreviewed")
@@ -278,54 +302,7 @@ class TestViewerTextualReport(unittest.TestCase):
         self.assertIn("a.ts (src)", chunk_rows[0].old_text)
         self.assertIn("groups=PR-4,Auth", chunk_rows[0].old_text)
 
-    def test_switch_lines_table_mode_rebuilds_columns_when_missing(self):
-        class StubTable:
-            def __init__(self) -> None:
-                self.ordered_columns: list[str] = []
-                self.clear_calls: list[bool] = []
-
-            def clear(self, *, columns: bool) -> None:
-                self.clear_calls.append(columns)
-                if columns:
-                    self.ordered_columns = []
-
-            def add_columns(self, *names: str) -> None:
-                self.ordered_columns = list(names)
-
-        app = DiffgrTextualApp(
-            Path("dummy.diffgr.json"),
-            {"groups": [], "assignments": {}, "meta": {}},
-            [],
-            {},
-            {},
-            15,
-        )
-        table = StubTable()
-        app.query_one = lambda *_args, **_kwargs: table  # type: ignore[method-assign]
-
-        app._lines_table_mode = "chunk"
-        app._switch_lines_table_mode("chunk")
-
-        self.assertEqual(table.ordered_columns, ["old", "new", "kind", "content"])
-        self.assertEqual(table.clear_calls, [True])
-
-    def test_switch_lines_table_mode_side_by_side_uses_old_new_four_columns(self):
-        class StubTable:
-            def __init__(self) -> None:
-                self.ordered_columns: list[str] = []
-                self.clear_calls: list[bool] = []
-
-            def clear(self, *, columns: bool) -> None:
-                self.clear_calls.append(columns)
-                if columns:
-                    self.ordered_columns = []
-
-            def add_columns(self, *names: str) -> None:
-                self.ordered_columns = list(names)
-
-            def add_column(self, name: str, **_kwargs) -> None:
-                self.ordered_columns.append(name)
-
+    def test_switch_lines_table_mode(self):
         app = DiffgrTextualApp(
             Path("dummy.diffgr.json"),
             {"groups": [], "assignments": {}, "meta": {}},
@@ -334,91 +311,20 @@ class TestViewerTextualReport(unittest.TestCase):
             {},
             15,
         )
-        table = StubTable()
-        app.query_one = lambda *_args, **_kwargs: table  # type: ignore[method-assign]
-        app._group_report_text_widths = lambda *_args, **_kwargs: (42, 42)  # type: ignore[method-assign]
-
-        app._lines_table_mode = "chunk_compact"
-        app._switch_lines_table_mode("chunk_side_by_side")
-
-        self.assertEqual(table.ordered_columns, ["old#", "old", "new#", "new"])
-        self.assertEqual(table.clear_calls, [True])
-
-    def test_switch_lines_table_mode_side_by_side_rebuilds_when_width_changes(self):
-        class StubTable:
-            def __init__(self) -> None:
-                self.ordered_columns: list[str] = []
-                self.clear_calls: list[bool] = []
-
-            def clear(self, *, columns: bool) -> None:
-                self.clear_calls.append(columns)
-                if columns:
-                    self.ordered_columns = []
-
-            def add_columns(self, *names: str) -> None:
-                self.ordered_columns = list(names)
-
-            def add_column(self, name: str, **_kwargs) -> None:
-                self.ordered_columns.append(name)
-
-        app = DiffgrTextualApp(
-            Path("dummy.diffgr.json"),
-            {"groups": [], "assignments": {}, "meta": {}},
-            [],
-            {},
-            {},
-            15,
-        )
-        table = StubTable()
-        table.ordered_columns = ["old#", "old", "new#", "new"]
-        app.query_one = lambda *_args, **_kwargs: table  # type: ignore[method-assign]
-        app._group_report_text_widths = lambda *_args, **_kwargs: (46, 34)  # type: ignore[method-assign]
-        app._lines_table_mode = "chunk_side_by_side"
-        app._lines_side_by_side_widths = (40, 40)
+        for name, current_mode, current_widths, columns, report_widths, mode, expected in _SWITCH_LINES_TABLE_MODE_CASES:
+            table = _StubLinesTable()
+            table.ordered_columns = list(columns)
+            with (
+                self.subTest(name),
+                mock.patch.object(app, "query_one", return_value=table),
+                mock.patch.object(app, "_group_report_text_widths", return_value=report_widths),
+            ):
+                app._lines_table_mode = current_mode
+                app._lines_side_by_side_widths = current_widths
 
-        app._switch_lines_table_mode("chunk_side_by_side")
+                app._switch_lines_table_mode(mode)
 
-        self.assertEqual(table.clear_calls, [True])
-        self.assertEqual(table.ordered_columns, ["old#", "old", "new#", "new"])
-        self.assertEqual(app._lines_side_by_side_widths, (46, 34))
-
-    def test_switch_lines_table_mode_side_by_side_skips_rebuild_when_width_same(self):
-        class StubTable:
-            def __init__(self) -> None:
-                self.ordered_columns: list[str] = []
-                self.clear_calls: list[bool] = []
-
-            def clear(self, *, columns: bool) -> None:
-                self.clear_calls.append(columns)
-                if columns:
-                    self.ordered_columns = []
-
-            def add_columns(self, *names: str) -> None:
-                self.ordered_columns = list(names)
-
-            def add_column(self, name: str, **_kwargs) -> None:
-                self.ordered_columns.append(name)
-
-        app = DiffgrTextualApp(
-            Path("dummy.diffgr.json"),
-            {"groups": [], "assignments": {}, "meta": {}},
-            [],
-            {},
-            {},
-            15,
-        )
-        table = StubTable()
-        table.ordered_columns = ["old#", "old", "new#", "new"]
-        app.query_one = lambda *_args, **_kwargs: table  # type: ignore[method-assign]
-        app._group_report_text_widths = lambda *_args, **_kwargs: (40, 40)  # type: ignore[method-assign]
-        app._lines_table_mode = "chunk_side_by_side"
-        app._lines_side_by_side_widths = (40, 40)
-
-        app._switch_lines_table_mode("chunk_side_by_side")
-
-        self.assertEqual(table.clear_calls, [False])
-        self.assertEqual(table.ordered_columns, ["old#", "old", "new#", "new"])
-        self.assertEqual(app._lines_side_by_side_widths, (40, 40))
+                self.assertEqual((table.clear_calls, table.ordered_columns, app._lines_side_by_side_widths), expected)
 
     def test_on_resize_rerenders_width_sensitive_view(self):
         app = DiffgrTextualApp(
@@ -646,31 +552,26 @@ class TestViewerTextualReport(unittest.TestCase):
         self.assertEqual(app.chunk_detail_view_mode, "compact")
 
     def test_resolve_chunk_file_path_resolves_relative_from_source_parent_parent(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            root = Path(tmpdir)
-            source_dir = root / "samples" / "diffgr"
-            source_dir.mkdir(parents=True, exist_ok=True)
-            source_path = source_dir / "sample.diffgr.json"
-            source_path.write_text("{}", encoding="utf-8")
-            target = root / "src" / "mod.ts"
-            target.parent.mkdir(parents=True, exist_ok=True)
-            target.write_text("export const x = 1;\n", encoding="utf-8")
-            app = DiffgrTextualApp(
-                source_path,
-                {"groups": [], "assignments": {}, "meta": {}},
-                [],
-                {},
-                {},
-                15,
-            )
-            previous_cwd = Path.cwd()
-            try:
-                os.chdir(root)
-                resolved = app._resolve_chunk_file_path("src/mod.ts")
-            finally:
-                os.chdir(previous_cwd)
+        root = self._make_test_dir()
+        source_dir = root / "samples" / "diffgr"
+        source_dir.mkdir(parents=True, exist_ok=True)
+        source_path = source_dir / "sample.diffgr.json"
+        source_path.write_text("{}", encoding="utf-8")
+        target = root / "src" / "mod.ts"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("export const x = 1;\n", encoding="utf-8")
+        app = DiffgrTextualApp(
+            source_path,
+            {"groups": [], "assignments": {}, "meta": {}},
+            [],
+            {},
+            {},
+            15,
+        )
+        with mock.patch.object(Path, "cwd", return_value=root):
+            resolved = app._resolve_chunk_file_path("src/mod.ts")
 
-            self.assertEqual(resolved, (root / "src" / "mod.ts").resolve())
+        self.assertEqual(resolved, (root / "src" / "mod.ts").resolve())
 
     def test_preferred_open_line_uses_selected_anchor_then_chunk_new(self):
         app = DiffgrTextualApp(
@@ -794,99 +695,78 @@ class TestViewerTextualReport(unittest.TestCase):
             self.assertEqual(app.filter_text, "auth")
 
     def test_load_viewer_settings_reads_mode_and_custom_command(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            settings_path = Path(tmpdir) / "viewer_settings.json"
-            settings_path.write_text(
-                json.dumps(
-                    {
-                        "editorMode": "custom",
-                        "customEditorCommand": "code -g {path}:{line}",
-                    },
-                    ensure_ascii=False,
-                ),
-                encoding="utf-8",
+        root = self._make_test_dir()
+        settings_path = root / "viewer_settings.json"
+        settings_path.write_text(
+            json.dumps(
+                {
+                    "editorMode": "custom",
+                    "customEditorCommand": "code -g {path}:{line}",
+                },
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        with mock.patch.dict(os.environ, {"DIFFGR_VIEWER_SETTINGS": str(settings_path)}):
+            app = DiffgrTextualApp(
+                Path("dummy.diffgr.json"),
+                {"groups": [], "assignments": {}, "meta": {}},
+                [],
+                {},
+                {},
+                15,
             )
-            previous_env = os.environ.get("DIFFGR_VIEWER_SETTINGS")
-            os.environ["DIFFGR_VIEWER_SETTINGS"] = str(settings_path)
-            try:
-                app = DiffgrTextualApp(
-                    Path("dummy.diffgr.json"),
-                    {"groups": [], "assignments": {}, "meta": {}},
-                    [],
-                    {},
-                    {},
-                    15,
-                )
-            finally:
-                if previous_env is None:
-                    os.environ.pop("DIFFGR_VIEWER_SETTINGS", None)
-                else:
-                    os.environ["DIFFGR_VIEWER_SETTINGS"] = previous_env
 
-            self.assertEqual(app.editor_mode, "custom")
-            self.assertEqual(app.custom_editor_command, "code -g {path}:{line}")
+        self.assertEqual(app.editor_mode, "custom")
+        self.assertEqual(app.custom_editor_command, "code -g {path}:{line}")
 
     def test_load_viewer_settings_reads_diff_auto_wrap(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            settings_path = Path(tmpdir) / "viewer_settings.json"
-            settings_path.write_text(
-                json.dumps(
-                    {
-                        "editorMode": "auto",
-                        "diffAutoWrap": False,
-                    },
-                    ensure_ascii=False,
-                ),
-                encoding="utf-8",
+        root = self._make_test_dir()
+        settings_path = root / "viewer_settings.json"
+        settings_path.write_text(
+            json.dumps(
+                {
+                    "editorMode": "auto",
+                    "diffAutoWrap": False,
+                },
+                ensure_ascii=False,
+            ),
+            encoding="utf-8",
+        )
+        with mock.patch.dict(os.environ, {"DIFFGR_VIEWER_SETTINGS": str(settings_path)}):
+            app = DiffgrTextualApp(
+                Path("dummy.diffgr.json"),
+                {"groups": [], "assignments": {}, "meta": {}},
+                [],
+                {},
+                {},
+                15,
             )
-            previous_env = os.environ.get("DIFFGR_VIEWER_SETTINGS")
-            os.environ["DIFFGR_VIEWER_SETTINGS"] = str(settings_path)
-            try:
-                app = DiffgrTextualApp(
-                    Path("dummy.diffgr.json"),
-                    {"groups": [], "assignments": {}, "meta": {}},
-                    [],
-                    {},
-                    {},
-                    15,
-                )
-            finally:
-                if previous_env is None:
-                    os.environ.pop("DIFFGR_VIEWER_SETTINGS", None)
-                else:
-                    os.environ["DIFFGR_VIEWER_SETTINGS"] = previous_env
 
-            self.assertFalse(app.diff_auto_wrap)
+        self.assertFalse(app.diff_auto_wrap)
 
     def test_save_viewer_settings_writes_json_file(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            settings_path = Path(tmpdir) / "viewer_settings.json"
-            previous_env = os.environ.get("DIFFGR_VIEWER_SETTINGS")
-            os.environ["DIFFGR_VIEWER_SETTINGS"] = str(settings_path)
-            try:
-                app = DiffgrTextualApp(
-                    Path("dummy.diffgr.json"),
-                    {"groups": [], "assignments": {}, "meta": {}},
-                    [],
-                    {},
-                    {},
-                    15,
-                )
-                app.editor_mode = "cursor"
-                app.custom_editor_command = "cursor {path}"
-                app.diff_auto_wrap = False
-                saved = app._save_viewer_settings()
-            finally:
-                if previous_env is None:
-                    os.environ.pop("DIFFGR_VIEWER_SETTINGS", None)
-                else:
-                    os.environ["DIFFGR_VIEWER_SETTINGS"] = previous_env
-
-            self.assertTrue(saved)
-            payload = json.loads(settings_path.read_text(encoding="utf-8"))
-            self.assertEqual(payload["editorMode"], "cursor")
-            self.assertEqual(payload["customEditorCommand"], "cursor {path}")
-            self.assertEqual(payload["diffAutoWrap"], False)
+        root = self._make_test_dir()
+        settings_path = root / "viewer_settings.json"
+        with mock.patch.dict(os.environ, {"DIFFGR_VIEWER_SETTINGS": str(settings_path)}):
+            app = DiffgrTextualApp(
+                Path("dummy.diffgr.json"),
+                {"groups": [], "assignments": {}, "meta": {}},
+                [],
+                {},
+                {},
+                15,
+            )
+            app.editor_mode = "cursor"
+            app.custom_editor_command = "cursor {path}"
+            app.diff_auto_wrap = False
+            saved = app._save_viewer_settings()
+
+        self.assertTrue(saved)
+        payload = json.loads(settings_path.read_text(encoding="utf-8"))
+        self.assertEqual(payload["editorMode"], "cursor")
+        self.assertEqual(payload["customEditorCommand"], "cursor {path}")
+        self.assertEqual(payload["diffAutoWrap"], False)
 
     def test_action_toggle_auto_wrap_toggles_and_rerenders(self):
         app = DiffgrTextualApp(